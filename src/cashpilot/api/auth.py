@@ -1,7 +1,8 @@
 # File: src/cashpilot/api/auth.py
 """Authentication endpoints and dependencies."""
 
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
@@ -16,7 +17,6 @@ from cashpilot.core.db import get_db
 from cashpilot.core.logging import get_logger
 from cashpilot.core.security import verify_password
 from cashpilot.models.user import User, UserRole
-from cashpilot.utils.datetime import now_utc
 
 logger = get_logger(__name__)
 
@@ -49,6 +49,32 @@ async def login_page(request: Request, expired: str = None, error: str = None):
     )
 
 
+def _parse_last_activity(raw: object) -> int | None:
+    """Read session["last_activity"] as epoch seconds.
+
+    New sessions store an int; cookies issued before that hold an ISO 8601
+    string, which is still accepted (naive values are taken as UTC).
+    """
+    if isinstance(raw, int):
+        return raw
+    if not raw or not isinstance(raw, str):
+        return None
+    try:
+        last_activity = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    if last_activity.tzinfo is None:
+        last_activity = last_activity.replace(tzinfo=timezone.utc)
+    return int(last_activity.timestamp())
+
+
+async def _load_user_by_id(user_id: UUID, db: AsyncSession) -> User | None:
+    """Load an active user by id, or None if missing or deactivated."""
+    stmt = select(User).where((User.id == user_id) & (User.is_active))
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
 async def get_current_user(
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -74,36 +100,23 @@ async def get_current_user(
     # Enforce role-based inactivity timeout
     if user_role and user_role in ROLE_TIMEOUTS:
         timeout = ROLE_TIMEOUTS[user_role]
-        now = now_utc()
+        now = int(time.time())
 
         last_activity_raw = request.session.get("last_activity") if request.session else None
+        last_activity = _parse_last_activity(last_activity_raw)
 
-        try:
-            if last_activity_raw and isinstance(last_activity_raw, str):
-                # Parse ISO format string - it should include timezone info
-                last_activity = datetime.fromisoformat(last_activity_raw)
-                # Ensure it's timezone-aware (backward compatibility)
-                if last_activity.tzinfo is None:
-                    last_activity = last_activity.replace(tzinfo=timezone.utc)
-            else:
-                last_activity = None
-
-        except (ValueError, TypeError):
-            last_activity = None
-
-        if last_activity and (now - last_activity) > timedelta(seconds=timeout):
+        if last_activity is not None and now - last_activity > timeout:
             if request.session:
                 request.session.clear()
 
-            time_elapsed = now - last_activity
             logger.info(
                 "auth.session_expired",
                 user_id=user_id,
                 role=user_role,
                 timeout_seconds=timeout,
-                time_elapsed_seconds=round(time_elapsed.total_seconds(), 2),
-                last_activity_utc=last_activity.isoformat(),
-                current_time_utc=now.isoformat(),
+                time_elapsed_seconds=now - last_activity,
+                last_activity_utc=datetime.fromtimestamp(last_activity, timezone.utc).isoformat(),
+                current_time_utc=datetime.fromtimestamp(now, timezone.utc).isoformat(),
             )
 
             is_htmx = request.headers.get("HX-Request") == "true" if request.headers else False
@@ -122,7 +135,7 @@ async def get_current_user(
                 )
         else:
             if request.session:
-                request.session["last_activity"] = now.isoformat()
+                request.session["last_activity"] = now
 
     try:
         if not isinstance(user_id, str):
@@ -134,9 +147,7 @@ async def get_current_user(
             detail="Invalid user session",
         )
 
-    stmt = select(User).where((User.id == user_uuid) & (User.is_active))
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await _load_user_by_id(user_uuid, db)
 
     if not user:
         raise HTTPException(
@@ -205,7 +216,7 @@ async def login(
     request.session["user_display_name"] = user.display_name or ""
 
     if user.role in ROLE_TIMEOUTS:
-        request.session["last_activity"] = now_utc().isoformat()
+        request.session["last_activity"] = int(time.time())
 
     logger.info(
         "auth.login_success",
@@ -1,6 +1,6 @@
 """CashSession edit endpoints (patch open/closed sessions)."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cashpilot.api.auth import get_current_user
@@ -19,12 +19,16 @@ from cashpilot.utils.datetime import now_utc
 
 FREEZE_PERIOD_DAYS = 30
 
+# Response header carrying the id of the audit log row written by an edit
+AUDIT_LOG_ID_HEADER = "X-Audit-Log-Id"
+
 router = APIRouter(prefix="/cash-sessions", tags=["cash-sessions-edit"])
 
 
 @router.patch("/{session_id}/edit-open", response_model=CashSessionRead)
 async def edit_open_session(
     session_id: str,
+    response: Response,
     patch: CashSessionPatchOpen,
     current_user: User = Depends(get_current_user),
     session: CashSession = Depends(require_own_session),
@@ -78,7 +82,7 @@ async def edit_open_session(
     }
 
     # Log to audit trail
-    await log_session_edit(
+    audit_log = await log_session_edit(
         db,
         session,
         changed_by,
@@ -92,6 +96,7 @@ async def edit_open_session(
     await db.commit()
     await db.refresh(session)
 
+    response.headers[AUDIT_LOG_ID_HEADER] = str(audit_log.id)
     return session
 
 
@@ -132,6 +137,7 @@ def _apply_patch_updates(session: CashSession, patch: CashSessionPatchClosed) ->
 @router.patch("/{session_id}/edit-closed", response_model=CashSessionRead)
 async def edit_closed_session(
     session_id: str,
+    response: Response,
     patch: CashSessionPatchClosed,
     current_user: User = Depends(get_current_user),
     session: CashSession = Depends(require_own_session),
@@ -168,7 +174,7 @@ async def edit_closed_session(
     new_values = _capture_session_values(session)
 
     # Log to audit trail
-    await log_session_edit(
+    audit_log = await log_session_edit(
         db,
         session,
         changed_by,
@@ -182,4 +188,5 @@ async def edit_closed_session(
     await db.commit()
     await db.refresh(session)
 
+    response.headers[AUDIT_LOG_ID_HEADER] = str(audit_log.id)
     return session
@@ -1,7 +1,6 @@
 # File: src/cashpilot/api/routes/business_stats.py
 """Business statistics report route."""
 
-import asyncio
 from datetime import date
 from decimal import Decimal
 
@@ -134,12 +133,11 @@ async def aggregate_business_metrics(
         .group_by(DailyReconciliation.business_id)
     )
 
-    # Execute all queries concurrently for better performance
-    result_financial, result_counts, result_recon = await asyncio.gather(
-        db.execute(stmt_financial),
-        db.execute(stmt_counts),
-        db.execute(stmt_recon),
-    )
+    # Run the queries one after another: an AsyncSession doesn't support
+    # concurrent operations, and they share one connection anyway
+    result_financial = await db.execute(stmt_financial)
+    result_counts = await db.execute(stmt_counts)
+    result_recon = await db.execute(stmt_recon)
     financial_rows = result_financial.all()
     count_rows = result_counts.all()
     recon_rows = result_recon.all()
@@ -323,7 +321,7 @@ async def business_stats(
     # Calculate previous period for comparison
     prev_from, prev_to = calculate_comparison_range(view, current_from, current_to)
 
-    # Aggregate metrics for current and previous periods concurrently
+    # Aggregate metrics for current and previous periods
     # Cache keyed by date range (not user — RBAC filtering happens after)
     today_date = today_local()
 
@@ -347,10 +345,10 @@ async def business_stats(
         set_cache(key, result, ttl_seconds=_metrics_cache_ttl(fd, td))
         return result
 
-    current_metrics, previous_metrics = await asyncio.gather(
-        _get_or_fetch_metrics(current_from, current_to),
-        _get_or_fetch_metrics(prev_from, prev_to),
-    )
+    # Sequential for the same reason as in aggregate_business_metrics: both
+    # periods query through this request's single AsyncSession
+    current_metrics = await _get_or_fetch_metrics(current_from, current_to)
+    previous_metrics = await _get_or_fetch_metrics(prev_from, prev_to)
 
     # Filter businesses by user role (AC-01, AC-02)
     businesses = await get_assigned_businesses(current_user, db)
@@ -3,6 +3,8 @@
 import os
 from typing import AsyncGenerator
 
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
@@ -30,6 +32,9 @@ AsyncSessionLocal = async_sessionmaker(
 # Declarative base
 Base = declarative_base()
 
+# JSONB on PostgreSQL, plain JSON elsewhere (the SQLite fast-test engine)
+JSONBCompat = JSON().with_variant(JSONB(), "postgresql")
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency for database sessions."""
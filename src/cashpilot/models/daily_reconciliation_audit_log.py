@@ -6,10 +6,10 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import DateTime, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from cashpilot.core.db import Base
+from cashpilot.core.db import Base, JSONBCompat
 from cashpilot.utils.datetime import now_utc
 
 if TYPE_CHECKING:
@@ -55,19 +55,19 @@ class DailyReconciliationAuditLog(Base):
 
     # WHICH FIELDS
     changed_fields: Mapped[list[str]] = mapped_column(
-        JSONB,
+        JSONBCompat,
         nullable=False,
         default=list,
     )
 
     # OLD/NEW VALUES
     old_values: Mapped[dict] = mapped_column(
-        JSONB,
+        JSONBCompat,
         nullable=False,
         default=dict,
     )
     new_values: Mapped[dict] = mapped_column(
-        JSONB,
+        JSONBCompat,
         nullable=False,
         default=dict,
     )
@@ -5,12 +5,9 @@ os.environ["TESTING"] = "true"
 import pytest_asyncio
 
 @pytest_asyncio.fixture
-async def app(db_session):
-    """Create FastAPI app instance with DB override for tests needing 'app' fixture."""
-    from cashpilot.api.auth import get_current_user
-    app = create_app()
-
-    # Create a default admin user for dependency override
+async def app(_app, _app_overrides, db_session):
+    """Shared FastAPI app with DB override for tests needing 'app' fixture."""
+    # Create a default admin user for requests without an X-Test-User-Id header
     admin_user = await UserFactory.create(
         db_session,
         email="admin_export_fixture@test.com",
@@ -18,35 +15,47 @@ async def app(db_session):
         role="ADMIN",
         is_active=True,
     )
-
-    async def override_get_db():
-        yield db_session
-
-    async def override_get_current_user():
-        return admin_user
-
-    app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[get_current_user] = override_get_current_user
-    return app
+    _app_overrides[""] = admin_user
+    return _app
 # File: tests/conftest.py
 """Pytest configuration and fixtures."""
 
+import asyncio
+import itertools
+import json
+import sys
+import time
+import uuid
+from base64 import b64encode
+from decimal import Decimal
+from typing import NamedTuple
+
 import asyncpg
 import pytest
 import pytest_asyncio
+from fastapi import HTTPException, Request, status
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-
+from itsdangerous import TimestampSigner
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from sqlalchemy import ColumnDefault, event, insert, select, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+
+from cashpilot.core import security
 from cashpilot.core.db import Base, get_db
 from cashpilot.core.security import hash_password
 from cashpilot.main import create_app
 
 # Import all models
-from cashpilot.models.business import Business  # noqa: F401
-from cashpilot.models.cash_session import CashSession  # noqa: F401
-from cashpilot.models.user import User  # noqa: F401
-from tests.factories import BusinessFactory, CashSessionFactory, UserFactory
+from cashpilot.models.business import Business
+from cashpilot.models.cash_session import CashSession
+from cashpilot.models.user import User
 from cashpilot.models.user_business import UserBusiness
+from tests.factories import BusinessFactory, CashSessionFactory, UserFactory
+from tests.helpers import TEST_USER_HEADER
 
 TEST_DATABASE_URL = (
     "postgresql+asyncpg://cashpilot:dev_password_change_in_prod@db:5432/cashpilot_test"
@@ -58,10 +67,93 @@ DB_USER = "cashpilot"
 DB_PASSWORD = "dev_password_change_in_prod"
 DB_NAME = "cashpilot_test"
 
+# CASHPILOT_FAST_TESTS=1 swaps Postgres for in-memory SQLite. Meant for CRUD-only
+# modules and tests marked `sqlite`, e.g. `CASHPILOT_FAST_TESTS=1 pytest -m sqlite`
+FAST_TESTS = os.environ.get("CASHPILOT_FAST_TESTS") == "1"
+SQLITE_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+# One schema per pytest-xdist worker ("master" when running without -n)
+TEST_SCHEMA = f"test_{os.environ.get('PYTEST_XDIST_WORKER', 'master')}"
+
+# Fixed ids for the client/admin_client users so one signed cookie fits every test
+CLIENT_USER_ID = uuid.UUID("00000000-0000-4000-8000-000000000001")
+ADMIN_USER_ID = uuid.UUID("00000000-0000-4000-8000-000000000002")
+
+
+def pytest_configure(config):
+    """Hash test passwords with minimal Argon2 work factors.
+
+    Runs before collection and before any fixture hashes a password, so the
+    suite doesn't pay ~300ms per hash and the weak hasher only exists under pytest.
+    """
+    security.password_hash = PasswordHash(
+        (Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1),)
+    )
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the test event loop on uvloop when it is available."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@compiles(PG_UUID, "sqlite")
+def _compile_uuid_for_sqlite(type_, compiler, **kw):
+    """Store UUIDs as text; a bare UUID column gets NUMERIC affinity in SQLite."""
+    return "CHAR(32)"
+
+
+def _create_sqlite_engine() -> AsyncEngine:
+    """In-memory SQLite engine that behaves like the Postgres one for db_session."""
+    engine = create_async_engine(
+        SQLITE_DATABASE_URL,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # Let SQLAlchemy drive BEGIN itself so SAVEPOINTs (create_savepoint) work
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # SQLite has no sequences: number cash sessions from a counter instead
+    session_numbers = itertools.count(1)
+    CashSession.__table__.c.session_number.default = ColumnDefault(
+        lambda: next(session_numbers)
+    )
+
+    return engine
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _engine():
+    """Create the test database and this worker's schema once per test session.
+
+    Each pytest-xdist worker gets its own schema via the connection's
+    search_path, so workers never see each other's rows. With
+    CASHPILOT_FAST_TESTS=1 an in-memory SQLite engine is used instead.
+    """
+    if FAST_TESTS:
+        engine = _create_sqlite_engine()
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        yield engine
+
+        await engine.dispose()
+        return
 
-@pytest_asyncio.fixture(scope="function", autouse=True)
-async def setup_test_database():
-    """Create test database using raw asyncpg connection."""
     try:
         # Connect to postgres database (always exists)
         conn = await asyncpg.connect(
@@ -82,77 +174,301 @@ async def setup_test_database():
     except Exception as e:
         print(f"Warning: Could not create test database: {e}")
 
-    yield
-
-
-@pytest_asyncio.fixture(scope="function")
-async def db_session():
-    """Create fresh DB session for each test."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-    async_session_maker = async_sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        pool_pre_ping=False,
+        connect_args={"server_settings": {"search_path": TEST_SCHEMA}},
     )
 
-    # Create tables
+    # Drop leftovers from an aborted run, then create tables once
     async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {TEST_SCHEMA}"))
+        await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
 
-    # Provide session
-    async with async_session_maker() as session:
-        yield session
-        await session.rollback()
+    # Pre-warm the pool so the first test doesn't pay the asyncpg handshake:
+    # one connection backs db_session, one serves health-check sessions
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(_ping(), _ping())
+
+    yield engine
 
     # Cleanup
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE"))
 
     await engine.dispose()
 
 
-@pytest_asyncio.fixture
-async def client(db_session):
-    """Create async test client with overridden DB dependency."""
-    import os
-    os.environ["SESSION_SECRET_KEY"] = "test-secret-key"
-    from cashpilot.api.auth import get_current_user
+@pytest_asyncio.fixture(scope="session")
+async def _connection(_engine):
+    """One connection and outer transaction shared by every test's db_session.
+
+    Nothing written through this connection is ever kept: module and test
+    data live in SAVEPOINTs that are rolled back, and so is the outer
+    transaction at the end of the run.
+    """
+    async with _engine.connect() as connection:
+        transaction = await connection.begin()
+
+        yield connection
+
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(_connection):
+    """Create DB session wrapped in a SAVEPOINT that is rolled back after each test.
+
+    Each test gets a SAVEPOINT on the session-wide connection, and the session
+    joins it with ``create_savepoint``, so ``commit()`` calls from factories
+    and endpoints only release a nested SAVEPOINT. Rolling back to the test's
+    SAVEPOINT discards everything it wrote without ending the outer transaction.
+    """
+    savepoint = await _connection.begin_nested()
+    session = AsyncSession(
+        bind=_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    yield session
+
+    await session.close()
+    if savepoint.is_active:
+        await savepoint.rollback()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def module_db_session(_connection):
+    """Session for rows shared by one module's tests.
+
+    Works like db_session one level up: the rows sit in a SAVEPOINT that every
+    test's own SAVEPOINT nests inside, and it is rolled back when the module
+    finishes, so other modules never see them.
+    """
+    savepoint = await _connection.begin_nested()
+    session = AsyncSession(
+        bind=_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    yield session
+
+    await session.close()
+    if savepoint.is_active:
+        await savepoint.rollback()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def _shared_rows(module_db_session: AsyncSession, _role_auth) -> dict:
+    """Insert the module's shared business and cashier in one flush."""
+    rows = {
+        "business": Business(
+            name="Shared Test Business",
+            address="Test Address",
+            phone="+595 21 123-4567",
+        ),
+        "other_cashier": User(
+            email="shared_other_cashier@test.com",
+            hashed_password=_role_auth["CASHIER"].hashed_password,
+            first_name="Test",
+            last_name="User",
+        ),
+    }
+    module_db_session.add_all(rows.values())
+    await module_db_session.commit()
+    return rows
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_business(_shared_rows: dict) -> Business:
+    """Business created once per module for tests that only need an FK.
+
+    Tests must not mutate it; use BusinessFactory.create for anything that
+    edits or counts businesses.
+    """
+    return _shared_rows["business"]
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_other_cashier(_shared_rows: dict) -> User:
+    """Cashier created once per module, owning sessions the client user doesn't."""
+    return _shared_rows["other_cashier"]
 
+
+@pytest_asyncio.fixture(scope="module")
+async def preseeded_sessions(
+    module_db_session: AsyncSession, shared_business: Business, shared_other_cashier: User
+) -> dict[str, CashSession]:
+    """Read-only cash sessions bulk-inserted once per module, keyed by scenario.
+
+    Tests that PATCH or close a session keep using CashSessionFactory so the
+    row they change belongs to them.
+    """
+    rows = {
+        "open_default": {"status": "OPEN"},
+        "closed_default": {"status": "CLOSED", "final_cash": Decimal("5000.00")},
+    }
+    ids = {name: uuid.uuid4() for name in rows}
+    values = [
+        {
+            "id": ids[name],
+            "business_id": shared_business.id,
+            "cashier_id": shared_other_cashier.id,
+            "created_by": shared_other_cashier.id,
+            "initial_cash": Decimal("1000000.00"),
+            **fields,
+        }
+        for name, fields in rows.items()
+    ]
+
+    # One multi-row INSERT instead of a flush per row
+    await module_db_session.execute(insert(CashSession), values)
+    await module_db_session.commit()
+    result = await module_db_session.execute(
+        select(CashSession).where(CashSession.id.in_(ids.values()))
+    )
+    by_id = {cash_session.id: cash_session for cash_session in result.scalars()}
+    await module_db_session.commit()
+
+    return {name: by_id[ids[name]] for name in rows}
+
+
+def _session_cookie(session: dict) -> str:
+    """Sign a session dict the way Starlette's SessionMiddleware does."""
+    data = b64encode(json.dumps(session).encode("utf-8"))
+    signer = TimestampSigner(os.environ["SESSION_SECRET_KEY"])
+    return f"session={signer.sign(data).decode('utf-8')}"
+
+
+class _RoleAuth(NamedTuple):
+    hashed_password: str
+    cookie: str
+
+
+@pytest.fixture(scope="session")
+def _role_auth() -> dict[str, _RoleAuth]:
+    """Password hash and signed session cookie per client role, built once.
+
+    The client users are re-created in every test (the transaction rolls back)
+    but with fixed ids, so these cookies stay valid and no test pays for an
+    Argon2 hash or a /login round trip.
+    """
+    last_activity = int(time.time())
+    return {
+        "CASHIER": _RoleAuth(
+            hash_password("testpass123"),
+            _session_cookie({
+                "user_id": str(CLIENT_USER_ID),
+                "user_role": "CASHIER",
+                "user_display_name": "Test Client",
+                "last_activity": last_activity,
+            }),
+        ),
+        "ADMIN": _RoleAuth(
+            hash_password("adminpass123"),
+            _session_cookie({
+                "user_id": str(ADMIN_USER_ID),
+                "user_role": "ADMIN",
+                "user_display_name": "Admin User",
+                "last_activity": last_activity,
+            }),
+        ),
+    }
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _app():
+    """Build the FastAPI app once per test session and warm it up.
+
+    Starlette builds its middleware stack and Jinja compiles templates on the
+    first request, so that cost is paid here instead of by the first test. No
+    overrides are installed yet: the API probes stop at get_current_user's 401
+    before any database access, and their status codes are ignored.
+    """
     app = create_app()
 
+    probe_id = uuid.uuid4()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        await ac.get("/login")
+        await ac.get(f"/cash-sessions/{probe_id}")
+        await ac.patch(f"/cash-sessions/{probe_id}/edit-open", json={})
+        await ac.patch(f"/cash-sessions/{probe_id}/edit-closed", json={})
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def _transport(_app):
+    """ASGI transport shared by every client built on the session app."""
+    return ASGITransport(app=_app)
+
+
+@pytest.fixture
+def _app_overrides(_app, db_session):
+    """Point the shared app at this test's DB session and registered users.
+
+    Clients register their user under the id they send in ``X-Test-User-Id``,
+    so a test can drive ``client`` and ``admin_client`` against the same app
+    and each request still resolves to the right user.
+    """
+    from cashpilot.api.auth import get_current_user
+
+    users: dict[str, User] = {}
+
+    async def override_get_db():
+        yield db_session
+
+    async def override_get_current_user(request: Request) -> User:
+        user = users.get(request.headers.get(TEST_USER_HEADER, ""))
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+            )
+        return user
+
+    _app.dependency_overrides[get_db] = override_get_db
+    _app.dependency_overrides[get_current_user] = override_get_current_user
+
+    yield users
+
+    _app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def client(_transport, _app_overrides, _role_auth, db_session):
+    """Create async test client with overridden DB dependency."""
     # Create a test user (CASHIER by default)
     test_user = await UserFactory.create(
         db_session,
+        id=CLIENT_USER_ID,
         email="testclient@example.com",
         first_name="Test",
         last_name="Client",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=_role_auth["CASHIER"].hashed_password,
     )
+    _app_overrides[str(test_user.id)] = test_user
 
-    # Override dependencies
-    async def override_get_db():
-        yield db_session
-
-    async def override_get_current_user():
-        return test_user
-
-    app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[get_current_user] = override_get_current_user
-
-    # Create client
+    # Create client already carrying the cashier's session cookie
     async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test"
+        transport=_transport,
+        base_url="http://test",
+        follow_redirects=False,
+        headers={
+            TEST_USER_HEADER: str(test_user.id),
+            "cookie": _role_auth["CASHIER"].cookie,
+        },
     ) as ac:
         # Attach test_user to client for test access
         ac.test_user = test_user
         ac.db_session = db_session
-        # Perform login to set session cookie
-        login_response = await ac.post(
-            "/login",
-            data={"username": test_user.email, "password": "testpass123"},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            follow_redirects=True,
-        )
-        assert login_response.status_code in [302, 303, 200], f"Login failed: {login_response.status_code}"
         yield ac
 
 
@@ -210,37 +526,46 @@ async def test_user(db_session: AsyncSession, request) -> User:
 
 @pytest.fixture
 async def unauthenticated_client(
+        _app,
+        _transport,
+        _app_overrides,
         db_session: AsyncSession,
 ) -> AsyncClient:
-    """AsyncClient without authentication overrides (for testing auth failures)."""
-    app = create_app()
+    """AsyncClient with no session cookie, run against the real auth dependency.
+
+    Only get_db stays overridden: the get_current_user stub is removed for the
+    test, so auth failures come from cashpilot.api.auth, not from conftest.
+    """
+    from cashpilot.api.auth import get_current_user
+
+    stub = _app.dependency_overrides.pop(get_current_user)
 
     async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test"
+            transport=_transport,
+            base_url="http://test",
+            follow_redirects=False,
     ) as ac:
         ac.db_session = db_session
         yield ac
 
+    _app.dependency_overrides[get_current_user] = stub
+
 
 @pytest_asyncio.fixture
-async def client_for_health_checks(db_session: AsyncSession):
+async def client_for_health_checks(_engine):
     """
     Create a test client for health check endpoints with proper database session management.
 
-    Creates a new engine and session factory to ensure fresh sessions per request,
-    which is required for health check endpoints that need to test database connectivity.
+    Uses fresh sessions per request from the shared test engine, which is required
+    for health check endpoints that need to test database connectivity. Reusing the
+    session-scoped engine keeps its pool warm instead of reconnecting per test.
     """
-    from httpx import ASGITransport, AsyncClient
-    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker
 
     app = create_app()
 
-    # Create a new engine using the same database URL
-    # Tables are already created by db_session fixture, so we just need the engine
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
     async_session_maker = async_sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
+        _engine, class_=AsyncSession, expire_on_commit=False
     )
 
     # Override get_db dependency to create a new session for each request
@@ -259,60 +584,36 @@ async def client_for_health_checks(db_session: AsyncSession):
         transport=ASGITransport(app=app),
         base_url="http://test"
     ) as ac:
-        # Store engine reference to prevent garbage collection
-        ac.test_engine = engine
         yield ac
 
-    # Cleanup
-    await engine.dispose()
 
 @pytest_asyncio.fixture
-async def admin_client(db_session):
+async def admin_client(_transport, _app_overrides, _role_auth, db_session):
     """Create async test client with admin user."""
-    from cashpilot.api.auth import get_current_user
     from cashpilot.models.user import UserRole
 
-    app = create_app()
-
     # Create admin user
     admin_user = await UserFactory.create(
         db_session,
+        id=ADMIN_USER_ID,
         email="admin@example.com",
         first_name="Admin",
         last_name="User",
         role=UserRole.ADMIN,
-        hashed_password=hash_password("adminpass123"),
+        hashed_password=_role_auth["ADMIN"].hashed_password,
     )
+    _app_overrides[str(admin_user.id)] = admin_user
 
-    # Override dependencies
-    async def override_get_db():
-        yield db_session
-
-    async def override_get_current_user():
-        return admin_user
-
-    app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[get_current_user] = override_get_current_user
-
-    # Create client
+    # Create client already carrying the admin's session cookie
     async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test"
+        transport=_transport,
+        base_url="http://test",
+        follow_redirects=False,
+        headers={
+            TEST_USER_HEADER: str(admin_user.id),
+            "cookie": _role_auth["ADMIN"].cookie,
+        },
     ) as ac:
         ac.test_user = admin_user
         ac.db_session = db_session
-        # Perform login to set session cookie
-        login_response = await ac.post(
-            "/login",
-            data={"username": admin_user.email, "password": "adminpass123"},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            follow_redirects=False,
-        )
-        assert login_response.status_code in [302, 303, 200], f"Admin login failed: {login_response.status_code}"
-        # Manually set session cookie for subsequent requests
-        set_cookie = login_response.headers.get("set-cookie")
-        if set_cookie:
-            # Only set the cookie name and value, not attributes
-            cookie_value = set_cookie.split(";", 1)[0]
-            ac.headers["cookie"] = cookie_value
         yield ac
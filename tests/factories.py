@@ -1,11 +1,14 @@
 # File: tests/factories.py
 """Factory classes for creating test objects."""
 
+import functools
+import itertools
+import uuid
 from datetime import date as date_type, time
 from decimal import Decimal
 from typing import Optional
-import uuid
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cashpilot.core.security import hash_password
@@ -14,6 +17,51 @@ from cashpilot.models.cash_session import CashSession
 from cashpilot.models.daily_reconciliation import DailyReconciliation
 from cashpilot.models.user import User
 
+# Sequential user ids: unique within a test run, reproducible across runs, and
+# disjoint from conftest's fixed client ids (those carry the version-4 bits)
+_user_ids = itertools.count(1)
+
+
+@functools.cache
+def _default_hashed_password() -> str:
+    """Hash of the default test password, computed once on first use.
+
+    Lazy so it picks up the test hasher conftest's pytest_configure swaps in.
+    """
+    return hash_password("testpass123")
+
+
+async def _insert_returning(session: AsyncSession, model, **values):
+    """Insert one row with INSERT ... RETURNING and commit.
+
+    The row comes back fully loaded, server defaults included, so callers skip
+    the refresh() SELECT that session.add() + commit() would need.
+    """
+    obj = await session.scalar(insert(model).values(**values).returning(model))
+    await session.commit()
+    return obj
+
+
+async def _add_all(session: AsyncSession, objects: list) -> list:
+    """Add several objects and flush them in one round trip."""
+    session.add_all(objects)
+    await session.flush()
+    return objects
+
+
+def _apply_overrides(values: dict, overrides: dict) -> dict:
+    """Overlay overrides on a factory's defaults.
+
+    Keys that are not in the defaults are ignored, and None keeps the default,
+    so create() and create_many() rows accept the same keyword arguments.
+    """
+    values.update(
+        (key, value)
+        for key, value in overrides.items()
+        if key in values and value is not None
+    )
+    return values
+
 
 class UserFactory:
     """Factory for creating User objects."""
@@ -32,7 +80,7 @@ class UserFactory:
     ) -> User:
         """Create a test user."""
         if hashed_password is None:
-            hashed_password = hash_password("testpass123")
+            hashed_password = _default_hashed_password()
 
         # If full_name is provided, split into first and last name
         if full_name:
@@ -44,8 +92,10 @@ class UserFactory:
                 first_name = parts[0]
                 last_name = " ".join(parts[1:])
 
-        user = User(
-            id=kwargs.get("id", uuid.uuid4()),
+        return await _insert_returning(
+            session,
+            User,
+            id=kwargs.get("id") or uuid.UUID(int=next(_user_ids)),
             email=email,
             hashed_password=hashed_password,
             first_name=first_name,
@@ -54,169 +104,208 @@ class UserFactory:
             is_active=is_active,
         )
 
-        session.add(user)
-        await session.commit()
-        await session.refresh(user)
-
-        return user
-
 
 class BusinessFactory:
     """Factory for creating Business objects."""
 
     @staticmethod
-    async def create(
-        session: AsyncSession,
-        name: str = "Test Business",
-        address: Optional[str] = "Test Address",
-        phone: Optional[str] = "+595 21 123-4567",
-        is_active: bool = True,
-        **kwargs,
-    ) -> Business:
-        """Create a test business."""
-        business = Business(
-            id=kwargs.get("id", uuid.uuid4()),
-            name=name,
-            address=address,
-            phone=phone,
-            is_active=is_active,
+    def _defaults(**overrides) -> dict:
+        """Column values for one test business."""
+        return _apply_overrides(
+            {
+                "id": uuid.uuid4(),
+                "name": "Test Business",
+                "address": "Test Address",
+                "phone": "+595 21 123-4567",
+                "is_active": True,
+            },
+            overrides,
         )
 
-        session.add(business)
-        await session.commit()
-        await session.refresh(business)
+    @staticmethod
+    async def create(session: AsyncSession, **overrides) -> Business:
+        """Create a test business."""
+        return await _insert_returning(
+            session, Business, **BusinessFactory._defaults(**overrides)
+        )
 
-        return business
+    @staticmethod
+    async def create_many(
+        session: AsyncSession,
+        rows: list[dict],
+    ) -> list[Business]:
+        """Create several test businesses with a single flush.
+
+        Each row takes create()'s keyword arguments.
+        """
+        return await _add_all(
+            session, [Business(**BusinessFactory._defaults(**row)) for row in rows]
+        )
 
 
 class CashSessionFactory:
     """Factory for creating CashSession objects."""
 
+    @staticmethod
+    def _defaults(**overrides) -> dict:
+        """Column values for one test cash session; created_by defaults to the cashier."""
+        values = _apply_overrides(
+            {
+                "id": uuid.uuid4(),
+                "business_id": None,
+                "cashier_id": None,
+                "created_by": None,
+                "initial_cash": Decimal("1000000.00"),
+                "session_date": date_type.today(),
+                "opened_time": time(9, 0),
+                "status": "OPEN",
+                "final_cash": None,
+                "envelope_amount": Decimal("0.00"),
+                "card_total": Decimal("0.00"),
+                "bank_transfer_total": Decimal("0.00"),
+                "expenses": Decimal("0.00"),
+                "notes": None,
+                "closed_time": None,
+                "closing_ticket": None,
+                "flagged": False,
+                "flag_reason": None,
+                "is_deleted": False,
+            },
+            overrides,
+        )
+        values["created_by"] = values["created_by"] or values["cashier_id"]
+        return values
+
+    @staticmethod
+    async def _create_cashier(session: AsyncSession) -> User:
+        """Create a cashier for sessions created without one."""
+        return await UserFactory.create(
+            session,
+            email=f"cashier_{uuid.uuid4().hex[:8]}@test.com"
+        )
+
     @staticmethod
     async def create(
         session: AsyncSession,
         business_id: Optional[uuid.UUID] = None,
         cashier_id: Optional[uuid.UUID] = None,
-        created_by: Optional[uuid.UUID] = None,
-        initial_cash: Decimal = Decimal("1000000.00"),
-        session_date: Optional[date_type] = None,
-        opened_time: Optional[time] = None,
-        status: str = "OPEN",
-        final_cash: Optional[Decimal] = None,
-        envelope_amount: Decimal = Decimal("0.00"),
-        card_total: Decimal = Decimal("0.00"),
-        bank_transfer_total: Decimal = Decimal("0.00"),
-        expenses: Decimal = Decimal("0.00"),
-        notes: Optional[str] = None,
-        closed_time: Optional[time] = None,
-        closing_ticket: Optional[str] = None,
-        flagged: bool = False,
-        flag_reason: Optional[str] = None,
-        **kwargs,
+        **overrides,
     ) -> CashSession:
-        """Create a test cash session."""
-        # Create business if not provided
+        """Create a test cash session, with its own business and cashier if not given."""
         if business_id is None:
-            business = await BusinessFactory.create(session)
-            business_id = business.id
-
-        # Create user for cashier_id if not provided
+            business_id = (await BusinessFactory.create(session)).id
         if cashier_id is None:
-            user = await UserFactory.create(
-                session,
-                email=f"cashier_{uuid.uuid4().hex[:8]}@test.com"
-            )
-            cashier_id = user.id
-
-        # Default created_by to cashier_id
-        if created_by is None:
-            created_by = cashier_id
-
-        if session_date is None:
-            session_date = date_type.today()
-
-        if opened_time is None:
-            opened_time = time(9, 0)
-
-        cash_session = CashSession(
-            id=kwargs.get("id", uuid.uuid4()),
-            business_id=business_id,
-            cashier_id=cashier_id,
-            created_by=created_by,
-            initial_cash=initial_cash,
-            session_date=session_date,
-            opened_time=opened_time,
-            status=status,
-            final_cash=final_cash,
-            envelope_amount=envelope_amount,
-            card_total=card_total,
-            bank_transfer_total=bank_transfer_total,
-            expenses=expenses,
-            notes=notes,
-            closed_time=closed_time,
-            closing_ticket=closing_ticket,
-            flagged=flagged,
-            flag_reason=flag_reason,
-            is_deleted=kwargs.get("is_deleted", False),
+            cashier_id = (await CashSessionFactory._create_cashier(session)).id
+
+        return await _insert_returning(
+            session,
+            CashSession,
+            **CashSessionFactory._defaults(
+                **overrides, business_id=business_id, cashier_id=cashier_id
+            ),
         )
 
-        session.add(cash_session)
-        await session.commit()
-        await session.refresh(cash_session)
-
-        return cash_session
+    @staticmethod
+    async def create_many(
+        session: AsyncSession,
+        rows: list[dict],
+    ) -> list[CashSession]:
+        """Create several test cash sessions with a single flush.
+
+        Each row takes create()'s keyword arguments; business_id is required and
+        rows without a cashier_id share one cashier user.
+        """
+        cashier_id = None
+        if any(row.get("cashier_id") is None for row in rows):
+            cashier_id = (await CashSessionFactory._create_cashier(session)).id
+
+        return await _add_all(
+            session,
+            [
+                CashSession(
+                    **CashSessionFactory._defaults(
+                        **{**row, "cashier_id": row.get("cashier_id") or cashier_id}
+                    )
+                )
+                for row in rows
+            ],
+        )
 
 
 class DailyReconciliationFactory:
     """Factory for creating DailyReconciliation objects."""
 
+    @staticmethod
+    def _defaults(**overrides) -> dict:
+        """Column values for one test daily reconciliation."""
+        return _apply_overrides(
+            {
+                "id": uuid.uuid4(),
+                "business_id": None,
+                "admin_id": None,
+                "date": date_type.today(),
+                "cash_sales": None,
+                "credit_sales": None,
+                "card_sales": None,
+                "total_sales": None,
+                "invoice_count": None,
+                "is_closed": False,
+            },
+            overrides,
+        )
+
+    @staticmethod
+    async def _create_admin(session: AsyncSession) -> User:
+        """Create an admin for reconciliations created without one."""
+        return await UserFactory.create(
+            session,
+            email=f"admin_{uuid.uuid4().hex[:8]}@test.com",
+            role="ADMIN",
+        )
+
     @staticmethod
     async def create(
         session: AsyncSession,
         business_id: Optional[uuid.UUID] = None,
         admin_id: Optional[uuid.UUID] = None,
-        date: Optional[date_type] = None,
-        cash_sales: Optional[Decimal] = None,
-        credit_sales: Optional[Decimal] = None,
-        card_sales: Optional[Decimal] = None,
-        total_sales: Optional[Decimal] = None,
-        invoice_count: Optional[int] = None,
-        is_closed: bool = False,
-        **kwargs,
+        **overrides,
     ) -> DailyReconciliation:
-        """Create a test daily reconciliation."""
-        # Create business if not provided
+        """Create a test daily reconciliation, with its own business and admin if not given."""
         if business_id is None:
-            business = await BusinessFactory.create(session)
-            business_id = business.id
-
-        # Create admin user if not provided
+            business_id = (await BusinessFactory.create(session)).id
         if admin_id is None:
-            admin = await UserFactory.create(
-                session,
-                email=f"admin_{uuid.uuid4().hex[:8]}@test.com",
-                role="ADMIN",
-            )
-            admin_id = admin.id
-
-        if date is None:
-            date = date_type.today()
-
-        reconciliation = DailyReconciliation(
-            id=kwargs.get("id", uuid.uuid4()),
-            business_id=business_id,
-            admin_id=admin_id,
-            date=date,
-            cash_sales=cash_sales,
-            credit_sales=credit_sales,
-            card_sales=card_sales,
-            total_sales=total_sales,
-            invoice_count=invoice_count,
-            is_closed=is_closed,
+            admin_id = (await DailyReconciliationFactory._create_admin(session)).id
+
+        return await _insert_returning(
+            session,
+            DailyReconciliation,
+            **DailyReconciliationFactory._defaults(
+                **overrides, business_id=business_id, admin_id=admin_id
+            ),
         )
 
-        session.add(reconciliation)
-        await session.commit()
-        await session.refresh(reconciliation)
-
-        return reconciliation
\ No newline at end of file
+    @staticmethod
+    async def create_many(
+        session: AsyncSession,
+        rows: list[dict],
+    ) -> list[DailyReconciliation]:
+        """Create several test daily reconciliations with a single flush.
+
+        Each row takes create()'s keyword arguments; business_id is required and
+        rows without an admin_id share one admin user.
+        """
+        admin_id = None
+        if any(row.get("admin_id") is None for row in rows):
+            admin_id = (await DailyReconciliationFactory._create_admin(session)).id
+
+        return await _add_all(
+            session,
+            [
+                DailyReconciliation(
+                    **DailyReconciliationFactory._defaults(
+                        **{**row, "admin_id": row.get("admin_id") or admin_id}
+                    )
+                )
+                for row in rows
+            ],
+        )
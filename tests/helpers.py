@@ -0,0 +1,47 @@
+# File: tests/helpers.py
+"""Constants and query helpers shared by test modules."""
+
+from collections import defaultdict
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cashpilot.models.daily_reconciliation_audit_log import DailyReconciliationAuditLog
+
+# Header the shared app's get_current_user override uses to pick the test user
+TEST_USER_HEADER = "X-Test-User-Id"
+
+
+async def fetch_audit_logs_by_ids(
+    session: AsyncSession, ids: list[UUID]
+) -> dict[UUID, list[DailyReconciliationAuditLog]]:
+    """Load the audit logs of several reconciliations in one query, keyed by reconciliation."""
+    stmt = select(DailyReconciliationAuditLog).where(
+        DailyReconciliationAuditLog.reconciliation_id.in_(ids)
+    )
+    result = await session.execute(stmt)
+
+    logs: dict[UUID, list[DailyReconciliationAuditLog]] = defaultdict(list)
+    for audit_log in result.scalars():
+        logs[audit_log.reconciliation_id].append(audit_log)
+    return logs
+
+
+async def count_audit_logs(session: AsyncSession, reconciliation_id: UUID) -> int:
+    """Count the audit logs of one reconciliation without loading them."""
+    stmt = (
+        select(func.count())
+        .select_from(DailyReconciliationAuditLog)
+        .where(DailyReconciliationAuditLog.reconciliation_id == reconciliation_id)
+    )
+    result = await session.execute(stmt)
+    return result.scalar_one()
+
+
+async def fetch_fields(session: AsyncSession, model: Any, id_: UUID, *columns: Any) -> Row:
+    """Select just the given columns of one row, instead of refreshing the whole object."""
+    stmt = select(*columns).where(model.id == id_)
+    result = await session.execute(stmt)
+    return result.one()
@@ -1,59 +1,48 @@
 """Tests for authentication endpoints."""
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cashpilot.core.security import hash_password
-from cashpilot.main import create_app
 from cashpilot.models.user import UserRole
 from tests.factories import UserFactory
+from tests.helpers import TEST_USER_HEADER
+
+_HASHED_PW = hash_password("testpass123")
 
 
 class TestAuthEndpoints:
     """Test authentication endpoints and middleware."""
 
     @pytest.mark.asyncio
-    async def test_protected_route_requires_auth(self, db_session: AsyncSession):
+    async def test_protected_route_requires_auth(self, unauthenticated_client: AsyncClient):
         """Test that protected routes require authentication."""
-        app = create_app()
-
-        async with AsyncClient(
-                transport=ASGITransport(app=app),
-                base_url="http://test"
-        ) as ac:
-            response = await ac.get("/")
-            assert response.status_code in [401, 303]
+        response = await unauthenticated_client.get("/")
+        # get_current_user raises 401; the app redirects it to the login page
+        assert response.status_code == 303
+        assert response.headers["location"].startswith("/login")
 
     @pytest.mark.asyncio
-    async def test_session_persistence(self, db_session: AsyncSession):
+    async def test_session_persistence(
+        self, _transport, _app_overrides, db_session: AsyncSession
+    ):
         """Test that session cookies persist across requests."""
-        from cashpilot.api.auth import get_current_user
-        from cashpilot.core.db import get_db
-
-        app = create_app()
-
         # Create test user
         user = await UserFactory.create(
             db_session,
             email="session@test.com",
-            hashed_password=hash_password("testpass123"),
+            hashed_password=_HASHED_PW,
         )
 
-        # Override dependencies
-        async def override_get_db():
-            yield db_session
-
-        async def override_get_current_user():
-            return user
-
-        app.dependency_overrides[get_db] = override_get_db
-        app.dependency_overrides[get_current_user] = override_get_current_user
+        # Resolve requests carrying this user's id to the user
+        _app_overrides[str(user.id)] = user
 
         async with AsyncClient(
-                transport=ASGITransport(app=app),
+                transport=_transport,
                 base_url="http://test",
-                follow_redirects=True  # Add this
+                follow_redirects=True,
+                headers={TEST_USER_HEADER: str(user.id)},
         ) as ac:
             # Now dashboard should work
             dashboard_response = await ac.get("/")
@@ -145,7 +134,7 @@ class TestUserCreationWithRoles:
             first_name="Test",
             last_name="Admin",
             role=UserRole.ADMIN,
-            hashed_password=hash_password("testpass123"),
+            hashed_password=_HASHED_PW,
         )
 
         response = await client.post(
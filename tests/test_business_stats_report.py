@@ -0,0 +1,38 @@
+# File: tests/test_business_stats_report.py
+"""Tests for the Business Stats report route."""
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cashpilot.core.cache import clear_cache
+from cashpilot.core.db import get_db
+
+
+async def test_business_stats_runs_on_a_fresh_session(
+    _app, _connection, client: AsyncClient
+):
+    """The route's queries must work when they are the first on the request's session.
+
+    db_session has usually checked out its connection by the time a request
+    arrives; a fresh session reproduces production, where the route's own
+    queries may be the first ones and must not run concurrently.
+    """
+    clear_cache("biz_stats")  # Make the route query instead of reading cached metrics
+    fresh_session = AsyncSession(
+        bind=_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    async def override_get_db():
+        yield fresh_session
+
+    shared_get_db = _app.dependency_overrides[get_db]
+    _app.dependency_overrides[get_db] = override_get_db
+    try:
+        response = await client.get("/reports/business-stats")
+    finally:
+        _app.dependency_overrides[get_db] = shared_get_db
+        await fresh_session.close()
+
+    assert response.status_code == 200
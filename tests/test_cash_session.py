@@ -3,32 +3,58 @@
 """Tests for cash session endpoints."""
 
 from datetime import timedelta
-from uuid import UUID
 
 import pytest
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cashpilot.models.business import Business
+from cashpilot.models.cash_session import CashSession
 from cashpilot.utils.datetime import today_local
 from tests.factories import BusinessFactory, CashSessionFactory
 
+_INITIAL_CASH = "500000.00"
+
+# Accepted status codes, built once at import
+_PAGE_OR_REDIRECT = frozenset({200, 302})
+_CLOSE_CONFLICT = frozenset({302, 400, 409})
+_VALIDATION_ERR = frozenset({400, 422})
+
+# Close payload with every payment method zeroed; tests add final_cash on top
+_CLOSE_PAYLOAD = {
+    "card_total": "0.00",
+    "envelope_amount": "0.00",
+    "bank_transfer_total": "0.00",
+    "closed_time": "18:00:00",
+}
+
+
+def assert_redirect(response: Response, prefix: str = "/sessions/") -> None:
+    """Assert a 302 whose Location starts with prefix, without reading the body."""
+    assert response.status_code == 302
+    assert response.headers["location"].startswith(prefix)
+
 
 @pytest.fixture
-async def business_id(db_session: AsyncSession) -> str:
+async def business(db_session: AsyncSession) -> Business:
     """Create a business for testing."""
-    business = await BusinessFactory.create(
+    return await BusinessFactory.create(
         db_session,
         name="Business Test",
         address="Calle Test 123",
         phone="+595972000000",
     )
+
+
+@pytest.fixture
+def business_id(business: Business) -> str:
+    """String id of the test business, as sent in request payloads."""
     return str(business.id)
 
 
 class TestListCashSessions:
     """Test listing cash sessions."""
 
-    @pytest.mark.asyncio
     async def test_list_sessions_with_filtering(
         self, admin_client: AsyncClient, db_session: AsyncSession, business_id: str
     ):
@@ -43,13 +69,16 @@ class TestListCashSessions:
 
         response = await admin_client.get("/")
         # Dashboard requires auth, redirects if not authenticated
-        assert response.status_code in [200, 302]
+        assert response.status_code in _PAGE_OR_REDIRECT
 
 
 class TestOpenCashSession:
-    """Test opening cash sessions."""
+    """Test opening cash sessions through the HTML form (/sessions).
+
+    Duplicate, cross-business and reopen rules are covered against the JSON
+    API in TestOpenCashSessionAPI; these keep form-specific coverage only.
+    """
 
-    @pytest.mark.asyncio
     async def test_open_session_success(
         self, admin_client: AsyncClient, db_session: AsyncSession, business_id: str
     ):
@@ -59,120 +88,23 @@ class TestOpenCashSession:
             data={
                 "business_id": business_id,
                 "cashier_name": "Juan",
-                "initial_cash": "500000.00",
-            },
-            follow_redirects=False,
-        )
-
-        assert response.status_code == 302
-
-    @pytest.mark.asyncio
-    async def test_open_session_minimal_data(
-        self, admin_client: AsyncClient, db_session: AsyncSession, business_id: str
-    ):
-        """Test opening session with minimal required data."""
-        response = await admin_client.post(
-            "/sessions",
-            data={
-                "business_id": business_id,
-                "cashier_name": "Test Cashier",
-                "initial_cash": "1000000.00",
-            },
-            follow_redirects=False,
-        )
-
-        assert response.status_code == 302
-
-    @pytest.mark.asyncio
-    async def test_open_session_duplicate(
-        self, admin_client: AsyncClient, db_session: AsyncSession, business_id: str
-    ):
-        """Test opening overlapping sessions."""
-        # Open first session
-        response1 = await admin_client.post(
-            "/sessions",
-            data={
-                "business_id": business_id,
-                "cashier_name": "Cashier 1",
-                "initial_cash": "500000.00",
-            },
-        )
-        assert response1.status_code == 302
-
-        # Try to open another at same time
-        response2 = await admin_client.post(
-            "/sessions",
-            data={
-                "business_id": business_id,
-                "cashier_name": "Cashier 2",
-                "initial_cash": "500000.00",
-            },
-            follow_redirects=False,
-        )
-        assert response2.status_code in [400, 409]
-
-    @pytest.mark.asyncio
-    async def test_open_session_allows_different_business(
-        self, admin_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test opening sessions in different businesses for same cashier."""
-        business_one = await BusinessFactory.create(db_session, name="Business One")
-        business_two = await BusinessFactory.create(db_session, name="Business Two")
-
-        response1 = await admin_client.post(
-            "/sessions",
-            data={
-                "business_id": str(business_one.id),
-                "cashier_name": "Cashier",
-                "initial_cash": "500000.00",
+                "initial_cash": _INITIAL_CASH,
             },
-            follow_redirects=False,
         )
-        assert response1.status_code == 302
 
-        response2 = await admin_client.post(
-            "/sessions",
-            data={
-                "business_id": str(business_two.id),
-                "cashier_name": "Cashier",
-                "initial_cash": "500000.00",
-            },
-            follow_redirects=False,
-        )
-        assert response2.status_code == 302
+        assert_redirect(response)
 
-    @pytest.mark.asyncio
-    async def test_open_session_allows_after_closing(
-        self, admin_client: AsyncClient, db_session: AsyncSession, business_id: str
-    ):
-        """Test opening new session after closing existing one."""
-        await CashSessionFactory.create(
-            db_session,
-            business_id=UUID(business_id),
-            cashier_id=admin_client.test_user.id,
-            status="CLOSED",
-        )
-
-        response = await admin_client.post(
-            "/sessions",
-            data={
-                "business_id": business_id,
-                "cashier_name": "Cashier",
-                "initial_cash": "500000.00",
-            },
-            follow_redirects=False,
-        )
-
-        assert response.status_code == 302
-
-    @pytest.mark.asyncio
     async def test_open_session_allows_with_soft_deleted_open(
-        self, admin_client: AsyncClient, db_session: AsyncSession, business_id: str
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        business: Business,
+        business_id: str,
     ):
         """Test opening new session when existing OPEN session is soft-deleted."""
         await CashSessionFactory.create(
             db_session,
-            business_id=UUID(business_id),
+            business_id=business.id,
             cashier_id=admin_client.test_user.id,
             status="OPEN",
             is_deleted=True,
@@ -183,26 +115,21 @@ class TestOpenCashSession:
             data={
                 "business_id": business_id,
                 "cashier_name": "Cashier",
-                "initial_cash": "500000.00",
+                "initial_cash": _INITIAL_CASH,
             },
-            follow_redirects=False,
         )
 
-        assert response.status_code == 302
+        assert_redirect(response)
 
 
 class TestGetCashSession:
     """Test retrieving session details."""
 
-    @pytest.mark.asyncio
-    async def test_get_session_success(self, admin_client: AsyncClient, db_session: AsyncSession):
+    async def test_get_session_success(
+        self, admin_client: AsyncClient, preseeded_sessions: dict[str, CashSession]
+    ):
         """Test retrieving a cash session details."""
-        business = await BusinessFactory.create(db_session)
-        session = await CashSessionFactory.create(
-            db_session,
-            business_id=business.id,
-            created_by=admin_client.test_user.id,
-        )
+        session = preseeded_sessions["open_default"]
 
         response = await admin_client.get(f"/cash-sessions/{session.id}")
 
@@ -214,158 +141,135 @@ class TestGetCashSession:
 class TestCloseCashSession:
     """Test closing sessions."""
 
-    @pytest.mark.asyncio
-    async def test_close_session_success(self, admin_client: AsyncClient, db_session: AsyncSession):
-        """Test closing a session."""
-        business = await BusinessFactory.create(db_session)
-        session = await CashSessionFactory.create(
+    @pytest.fixture
+    async def open_session(
+        self, admin_client: AsyncClient, db_session: AsyncSession, shared_business: Business
+    ) -> CashSession:
+        """OPEN session to close; built per test because closing mutates it."""
+        return await CashSessionFactory.create(
             db_session,
-            business_id=business.id,
+            business_id=shared_business.id,
             created_by=admin_client.test_user.id,
         )
 
+    async def test_close_session_success(
+        self, admin_client: AsyncClient, open_session: CashSession
+    ):
+        """Test closing a session."""
         response = await admin_client.put(
-            f"/cash-sessions/{session.id}",
-            json={
-                "final_cash": "550000.00",
-                "card_total": "150000.00",
-                "envelope_amount": "0.00",
-                "bank_transfer_total": "0.00",
-                "closed_time": "18:00:00",
-            },
+            f"/cash-sessions/{open_session.id}",
+            json={**_CLOSE_PAYLOAD, "final_cash": "550000.00", "card_total": "150000.00"},
         )
 
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_close_session_partial_data(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self, admin_client: AsyncClient, open_session: CashSession
     ):
         """Test closing with partial payment methods."""
-        business = await BusinessFactory.create(db_session)
-        session = await CashSessionFactory.create(
-            db_session,
-            business_id=business.id,
-            created_by=admin_client.test_user.id,
-        )
-
         response = await admin_client.put(
-            f"/cash-sessions/{session.id}",
-            json={
-                "final_cash": "500000.00",
-                "card_total": "0.00",
-                "envelope_amount": "0.00",
-                "bank_transfer_total": "0.00",
-                "closed_time": "18:00:00",
-            },
+            f"/cash-sessions/{open_session.id}",
+            json={**_CLOSE_PAYLOAD, "final_cash": "500000.00"},
         )
 
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_close_already_closed_session(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self, admin_client: AsyncClient, preseeded_sessions: dict[str, CashSession]
     ):
         """Test closing already closed session."""
-        business = await BusinessFactory.create(db_session)
-        session = await CashSessionFactory.create(
-            db_session,
-            business_id=business.id,
-            status="CLOSED",
-            created_by=admin_client.test_user.id,
-        )
+        closed_session = preseeded_sessions["closed_default"]
 
         response = await admin_client.put(
-            f"/cash-sessions/{session.id}",
-            json={
-                "final_cash": "600000.00",
-                "card_total": "0.00",
-                "envelope_amount": "0.00",
-                "bank_transfer_total": "0.00",
-                "closed_time": "18:00:00",
-            },
+            f"/cash-sessions/{closed_session.id}",
+            json={**_CLOSE_PAYLOAD, "final_cash": "600000.00"},
         )
 
-        assert response.status_code in [302, 400, 409]
+        assert response.status_code in _CLOSE_CONFLICT
 
-    @pytest.mark.asyncio
     async def test_close_without_required_fields(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self, admin_client: AsyncClient, preseeded_sessions: dict[str, CashSession]
     ):
         """Test closing without required fields."""
-        business = await BusinessFactory.create(db_session)
-        session = await CashSessionFactory.create(
-            db_session,
-            business_id=business.id,
-            created_by=admin_client.test_user.id,
-        )
-
+        # Rejected at validation, so the shared OPEN row is never touched
         response = await admin_client.put(
-            f"/cash-sessions/{session.id}",
+            f"/cash-sessions/{preseeded_sessions['open_default'].id}",
             json={"final_cash": "500000.00"},
         )
 
-        assert response.status_code in [400, 422]
+        assert response.status_code in _VALIDATION_ERR
 
 
 class TestOpenCashSessionAPI:
     """Test opening cash sessions via REST API (/cash-sessions POST)."""
 
-    @pytest.mark.asyncio
-    async def test_api_open_session_success(
-        self, admin_client: AsyncClient, db_session: AsyncSession, business_id: str
-    ):
-        """Test opening session via REST API."""
+    async def test_full_session_lifecycle(self, admin_client: AsyncClient, business_id: str):
+        """Open, reject a duplicate open, close, then reopen on the same day via API.
+
+        The duplicate check is the validation in open_shift() that catches
+        duplicates before they reach the database, returning 409 Conflict
+        instead of 500.
+        """
+        session_date = today_local().isoformat()
+
+        # Open first session
         response = await admin_client.post(
             "/cash-sessions",
             json={
                 "business_id": business_id,
-                "initial_cash": "500000.00",
+                "initial_cash": _INITIAL_CASH,
+                "session_date": session_date,
+                "opened_time": "06:00:00",
             },
         )
-
         assert response.status_code == 201
         data = response.json()
         assert data["status"] == "OPEN"
         assert float(data["initial_cash"]) == 500000.0
+        first_session_id = data["id"]
 
-    @pytest.mark.asyncio
-    async def test_api_prevent_duplicate_open_session(
-        self, admin_client: AsyncClient, db_session: AsyncSession, business_id: str
-    ):
-        """Test API prevents duplicate open sessions for same cashier/business.
-
-        This tests the new validation added in open_shift() to catch duplicates
-        before they reach the database, returning 409 Conflict instead of 500.
-        """
-        # Open first session via API
-        response1 = await admin_client.post(
+        # Second open for same cashier/business/date is rejected
+        response = await admin_client.post(
             "/cash-sessions",
             json={
                 "business_id": business_id,
-                "initial_cash": "500000.00",
+                "initial_cash": "600000.00",
+                "session_date": session_date,
             },
         )
-        assert response1.status_code == 201
+        assert response.status_code == 409
+        error = response.json()
+        assert error["code"] == "CONFLICT"
+        assert "already exists" in error["message"].lower()
+        assert "session_id" in error.get("details", {})
+        assert "session_number" in error.get("details", {})
 
-        # Try to open second session for same cashier/business
-        response2 = await admin_client.post(
+        # Close first session
+        response = await admin_client.put(
+            f"/cash-sessions/{first_session_id}",
+            json={
+                **_CLOSE_PAYLOAD,
+                "final_cash": "510000.00",
+                "expenses": "0.00",
+                "credit_sales_total": "0.00",
+                "credit_payments_collected": "0.00",
+                "closed_time": "07:00:00",
+            },
+        )
+        assert response.status_code == 200
+
+        # Open new session after closing
+        response = await admin_client.post(
             "/cash-sessions",
             json={
                 "business_id": business_id,
                 "initial_cash": "600000.00",
+                "session_date": session_date,
+                "opened_time": "08:00:00",
             },
         )
+        assert response.status_code == 201
 
-        # Should return 409 Conflict with clear error message
-        assert response2.status_code == 409
-        error = response2.json()
-        assert error["code"] == "CONFLICT"
-        assert "already exists" in error["message"].lower()
-        assert "session_id" in error.get("details", {})
-        assert "session_number" in error.get("details", {})
-
-    @pytest.mark.asyncio
     async def test_api_allow_different_business_sessions(
         self, admin_client: AsyncClient, db_session: AsyncSession
     ):
@@ -378,7 +282,7 @@ class TestOpenCashSessionAPI:
             "/cash-sessions",
             json={
                 "business_id": str(business_one.id),
-                "initial_cash": "500000.00",
+                "initial_cash": _INITIAL_CASH,
             },
         )
         assert response1.status_code == 201
@@ -397,7 +301,6 @@ class TestOpenCashSessionAPI:
 class TestRestoreCashSessionAPI:
     """Test restoring soft-deleted cash sessions via REST API."""
 
-    @pytest.mark.asyncio
     async def test_restore_open_session_conflicts_with_existing_open_session(
         self, admin_client: AsyncClient, db_session: AsyncSession
     ):
@@ -432,7 +335,6 @@ class TestRestoreCashSessionAPI:
         await db_session.refresh(deleted_session)
         assert deleted_session.is_deleted is True
 
-    @pytest.mark.asyncio
     async def test_restore_open_session_allows_existing_open_session_on_different_date(
         self, admin_client: AsyncClient, db_session: AsyncSession
     ):
@@ -466,51 +368,3 @@ class TestRestoreCashSessionAPI:
         data = response.json()
         assert data["id"] == str(deleted_session.id)
         assert data["is_deleted"] is False
-
-    @pytest.mark.asyncio
-    async def test_api_open_after_closing(
-        self, admin_client: AsyncClient, db_session: AsyncSession, business_id: str
-    ):
-        """Test can open new session after closing existing one via API."""
-        session_date = today_local().isoformat()
-
-        # Open first session
-        response1 = await admin_client.post(
-            "/cash-sessions",
-            json={
-                "business_id": business_id,
-                "initial_cash": "500000.00",
-                "session_date": session_date,
-                "opened_time": "06:00:00",
-            },
-        )
-        assert response1.status_code == 201
-        first_session_id = response1.json()["id"]
-
-        # Close first session
-        response_close = await admin_client.put(
-            f"/cash-sessions/{first_session_id}",
-            json={
-                "final_cash": "510000.00",
-                "card_total": "0.00",
-                "envelope_amount": "0.00",
-                "bank_transfer_total": "0.00",
-                "expenses": "0.00",
-                "credit_sales_total": "0.00",
-                "credit_payments_collected": "0.00",
-                "closed_time": "07:00:00",
-            },
-        )
-        assert response_close.status_code == 200
-
-        # Open new session after closing
-        response2 = await admin_client.post(
-            "/cash-sessions",
-            json={
-                "business_id": business_id,
-                "initial_cash": "600000.00",
-                "session_date": session_date,
-                "opened_time": "08:00:00",
-            },
-        )
-        assert response2.status_code == 201
@@ -0,0 +1,91 @@
+# File: tests/test_cash_session_bench.py
+"""Benchmarks for the cash-session open/close endpoints.
+
+Marked ``bench`` and deselected by default; run with ``make bench``, which
+compares against the last saved run and fails when the mean regresses by more
+than 10%.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import BusinessFactory, CashSessionFactory
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.bench
+
+_ROUNDS = 20
+
+_CLOSE_BODY = {
+    "final_cash": "550000.00",
+    "card_total": "150000.00",
+    "envelope_amount": "0.00",
+    "bank_transfer_total": "0.00",
+    "closed_time": "18:00:00",
+}
+
+
+@pytest_asyncio.fixture
+async def session_loop() -> asyncio.AbstractEventLoop:
+    """The session event loop, so sync benchmark bodies can drive async clients."""
+    return asyncio.get_running_loop()
+
+
+def test_open_session_bench(
+    benchmark,
+    session_loop: asyncio.AbstractEventLoop,
+    admin_client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """POST /cash-sessions: validation, RBAC, duplicate/overlap checks and insert."""
+
+    def setup():
+        # A fresh business per round, so no round hits the duplicate-session check
+        business = session_loop.run_until_complete(BusinessFactory.create(db_session))
+        body = {
+            "business_id": str(business.id),
+            "initial_cash": "500000.00",
+            "opened_time": "06:00:00",
+        }
+        return (body,), {}
+
+    def open_session(body):
+        return session_loop.run_until_complete(admin_client.post("/cash-sessions", json=body))
+
+    response = benchmark.pedantic(open_session, setup=setup, rounds=_ROUNDS)
+    assert response.status_code == 201
+
+
+def test_close_session_bench(
+    benchmark,
+    session_loop: asyncio.AbstractEventLoop,
+    admin_client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """PUT /cash-sessions/{id}: closing validation, update and serialization."""
+    business = session_loop.run_until_complete(BusinessFactory.create(db_session))
+
+    def setup():
+        # Each round closes its own open session
+        cash_session = session_loop.run_until_complete(
+            CashSessionFactory.create(
+                db_session,
+                business_id=business.id,
+                cashier_id=admin_client.test_user.id,
+            )
+        )
+        return (cash_session.id,), {}
+
+    def close_session(session_id):
+        return session_loop.run_until_complete(
+            admin_client.put(f"/cash-sessions/{session_id}", json=_CLOSE_BODY)
+        )
+
+    response = benchmark.pedantic(close_session, setup=setup, rounds=_ROUNDS)
+    assert response.status_code == 200
+    assert response.json()["status"] == "CLOSED"
@@ -1,73 +1,94 @@
 # File: tests/test_cash_session_edit.py
 """Tests for CashSession edit endpoints."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from decimal import Decimal
+from uuid import UUID
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cashpilot.api.cash_session_edit import AUDIT_LOG_ID_HEADER
 from cashpilot.models import CashSessionAuditLog
+from cashpilot.models.business import Business
+from cashpilot.models.cash_session import CashSession
+from cashpilot.models.user import User
 from cashpilot.utils.datetime import now_utc, utc_to_business
-from .factories import BusinessFactory, CashSessionFactory, UserFactory
-
-
-@pytest.mark.asyncio
-async def test_edit_open_session_cannot_edit_closed(
-    client: AsyncClient, db_session: AsyncSession
+from .factories import CashSessionFactory
+
+# Stored amounts the edit tests start from, parsed once at import
+_FINAL_5K = Decimal("5000.00")
+_CARD_1_5K = Decimal("1500.00")
+_FINAL_1234_56 = Decimal("1234.56")
+
+# Request bodies shared by several tests; treat as read-only
+_EDIT_OPEN_BODY = {"initial_cash": "1500.00"}
+_EDIT_CLOSED_BODY = {"final_cash": "5500.00", "reason": "Late correction"}
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "payload", "bad_status", "expected_word"),
+    [
+        ("edit-open", _EDIT_OPEN_BODY, "CLOSED", "OPEN"),
+        ("edit-closed", _EDIT_CLOSED_BODY, "OPEN", "CLOSED"),
+    ],
+    ids=["edit_open_rejects_closed", "edit_closed_rejects_open"],
+)
+async def test_edit_endpoint_rejects_wrong_status(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    shared_business: Business,
+    endpoint: str,
+    payload: dict,
+    bad_status: str,
+    expected_word: str,
 ):
-    """AC-04/AC-05: Edit-open endpoint rejects closed sessions."""
-    business = await BusinessFactory.create(db_session)
+    """AC-04/AC-05: Each edit endpoint rejects sessions in the other status."""
     session = await CashSessionFactory.create(
         db_session,
-        business_id=business.id,
+        business_id=shared_business.id,
         cashier_id=client.test_user.id,
-        status="CLOSED",
+        status=bad_status,
     )
 
-    response = await client.patch(
-        f"/cash-sessions/{session.id}/edit-open",
-        json={"initial_cash": "1500.00"},
-    )
+    response = await client.patch(f"/cash-sessions/{session.id}/{endpoint}", json=payload)
 
     assert response.status_code == 400
+    # A rejected edit writes no audit log, so the header must not point at one
+    assert AUDIT_LOG_ID_HEADER not in response.headers
     data = response.json()
     error_text = data.get("detail") or data.get("message") or str(data)
-    assert "OPEN" in error_text
+    assert expected_word in error_text
 
 
-@pytest.mark.asyncio
 async def test_edit_open_requires_auth(
-    unauthenticated_client: AsyncClient, db_session: AsyncSession
+    unauthenticated_client: AsyncClient,
+    preseeded_sessions: dict[str, CashSession],
 ):
     """AC-02: Unauthenticated requests are rejected."""
-    business = await BusinessFactory.create(db_session)
-    session = await CashSessionFactory.create(
-        db_session,
-        business_id=business.id,
-        status="OPEN",
-    )
+    session = preseeded_sessions["open_default"]
 
     response = await unauthenticated_client.patch(
         f"/cash-sessions/{session.id}/edit-open",
-        json={"initial_cash": "1500.00"},
+        json=_EDIT_OPEN_BODY,
     )
 
-    assert response.status_code in {401, 403, 303}
+    # The real get_current_user raises 401, which the app turns into a login redirect
+    assert response.status_code == 303
+    assert response.headers["location"].startswith("/login")
 
 
-@pytest.mark.asyncio
-async def test_edit_closed_session_final_cash(client: AsyncClient, db_session: AsyncSession):
+async def test_edit_closed_session_final_cash(
+    client: AsyncClient, db_session: AsyncSession, shared_business: Business
+):
     """Test editing final_cash on a closed session."""
-    business = await BusinessFactory.create(db_session)
     session = await CashSessionFactory.create(
         db_session,
-        business_id=business.id,
+        business_id=shared_business.id,
         cashier_id=client.test_user.id,
         status="CLOSED",
-        final_cash=Decimal("5000.00"),
+        final_cash=_FINAL_5K,
     )
 
     response = await client.patch(
@@ -79,27 +100,23 @@ async def test_edit_closed_session_final_cash(client: AsyncClient, db_session: A
     data = response.json()
     assert data["final_cash"] == "5500.00"
 
-    audit_stmt = select(CashSessionAuditLog).where(
-        CashSessionAuditLog.session_id == session.id
+    audit_log = await db_session.get(
+        CashSessionAuditLog, UUID(response.headers[AUDIT_LOG_ID_HEADER])
     )
-    audit_result = await db_session.execute(audit_stmt)
-    audit_log = audit_result.scalar_one_or_none()
     assert audit_log.action == "EDIT_CLOSED"
     assert audit_log.changed_fields == ["final_cash"]
 
 
-@pytest.mark.asyncio
 async def test_edit_closed_session_payment_totals(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient, db_session: AsyncSession, shared_business: Business
 ):
     """AC-04/AC-05: Can edit payment method totals on closed sessions."""
-    business = await BusinessFactory.create(db_session)
     session = await CashSessionFactory.create(
         db_session,
-        business_id=business.id,
+        business_id=shared_business.id,
         cashier_id=client.test_user.id,
         status="CLOSED",
-        card_total=Decimal("1500.00"),
+        card_total=_CARD_1_5K,
     )
 
     response = await client.patch(
@@ -115,40 +132,16 @@ async def test_edit_closed_session_payment_totals(
     assert data["card_total"] == "1800.00"
 
 
-@pytest.mark.asyncio
-async def test_edit_closed_session_cannot_edit_open(
-    client: AsyncClient, db_session: AsyncSession
+async def test_audit_log_serializes_decimals(
+    client: AsyncClient, db_session: AsyncSession, shared_business: Business
 ):
-    """Test that edit-closed endpoint rejects open sessions."""
-    business = await BusinessFactory.create(db_session)
-    session = await CashSessionFactory.create(
-        db_session,
-        business_id=business.id,
-        cashier_id=client.test_user.id,
-        status="OPEN",
-    )
-
-    response = await client.patch(
-        f"/cash-sessions/{session.id}/edit-closed",
-        json={"final_cash": "5000.00", "reason": "Test edit"},
-    )
-
-    assert response.status_code == 400
-    data = response.json()
-    error_text = data.get("detail") or data.get("message") or str(data)
-    assert "CLOSED" in error_text
-
-
-@pytest.mark.asyncio
-async def test_audit_log_serializes_decimals(client: AsyncClient, db_session: AsyncSession):
     """Test that audit logs properly serialize Decimal values to strings."""
-    business = await BusinessFactory.create(db_session)
     session = await CashSessionFactory.create(
         db_session,
-        business_id=business.id,
+        business_id=shared_business.id,
         cashier_id=client.test_user.id,
         status="CLOSED",
-        final_cash=Decimal("1234.56"),
+        final_cash=_FINAL_1234_56,
     )
 
     response = await client.patch(
@@ -158,107 +151,103 @@ async def test_audit_log_serializes_decimals(client: AsyncClient, db_session: As
 
     assert response.status_code == 200
 
-    audit_stmt = select(CashSessionAuditLog).where(
-        CashSessionAuditLog.session_id == session.id
+    audit_log = await db_session.get(
+        CashSessionAuditLog, UUID(response.headers[AUDIT_LOG_ID_HEADER])
     )
-    audit_result = await db_session.execute(audit_stmt)
-    audit_log = audit_result.scalar_one_or_none()
 
     assert audit_log.old_values["final_cash"] == "1234.56"
     assert audit_log.new_values["final_cash"] == "1999.99"
     assert isinstance(audit_log.old_values["final_cash"], str)
 
 
-@pytest.mark.asyncio
 async def test_cashier_can_edit_own_session(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient, db_session: AsyncSession, shared_business: Business
 ):
     """AC-02/AC-05: Cashier can edit their own session."""
-    business = await BusinessFactory.create(db_session)
     session = await CashSessionFactory.create(
         db_session,
-        business_id=business.id,
+        business_id=shared_business.id,
         cashier_id=client.test_user.id,
         status="OPEN",
     )
 
     response = await client.patch(
         f"/cash-sessions/{session.id}/edit-open",
-        json={"initial_cash": "1500.00"},
+        json=_EDIT_OPEN_BODY,
     )
 
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_cashier_cannot_edit_other_cashier_session(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    shared_business: Business,
+    shared_other_cashier: User,
 ):
     """AC-02/AC-05: Cashier cannot edit another cashier's session."""
-    business = await BusinessFactory.create(db_session)
-    other_cashier = await UserFactory.create(
-        db_session,
-        email="other_cashier_edit@test.com",
-    )
     session = await CashSessionFactory.create(
         db_session,
-        business_id=business.id,
-        cashier_id=other_cashier.id,
+        business_id=shared_business.id,
+        cashier_id=shared_other_cashier.id,
         status="OPEN",
     )
 
     response = await client.patch(
         f"/cash-sessions/{session.id}/edit-open",
-        json={"initial_cash": "1500.00"},
+        json=_EDIT_OPEN_BODY,
     )
 
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
+@pytest.fixture(params=[timedelta(hours=33), timedelta(hours=48)], ids=["33h", "48h"])
+def expired_close_ts(request) -> datetime:
+    """Business-local close time already outside the cashier's 32h edit window."""
+    return utc_to_business(now_utc() - request.param)
+
+
 async def test_cashier_cannot_edit_closed_session_after_32h(
-    client: AsyncClient, db_session: AsyncSession
+    client: AsyncClient,
+    db_session: AsyncSession,
+    shared_business: Business,
+    expired_close_ts: datetime,
 ):
     """AC-02/AC-05: Cashier cannot edit CLOSED session after 32 hours."""
-    business = await BusinessFactory.create(db_session)
-    closed_dt = utc_to_business(now_utc() - timedelta(hours=33))
     session = await CashSessionFactory.create(
         db_session,
-        business_id=business.id,
+        business_id=shared_business.id,
         cashier_id=client.test_user.id,
         status="CLOSED",
-        session_date=closed_dt.date(),
-        closed_time=closed_dt.time(),
+        session_date=expired_close_ts.date(),
+        closed_time=expired_close_ts.time(),
     )
 
     response = await client.patch(
         f"/cash-sessions/{session.id}/edit-closed",
-        json={"final_cash": "5500.00", "reason": "Late correction"},
+        json=_EDIT_CLOSED_BODY,
     )
 
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 async def test_admin_can_edit_any_session(
-    admin_client: AsyncClient, db_session: AsyncSession
+    admin_client: AsyncClient,
+    db_session: AsyncSession,
+    shared_business: Business,
+    shared_other_cashier: User,
 ):
     """AC-02/AC-05: Admin can edit any session."""
-    business = await BusinessFactory.create(db_session)
-    other_cashier = await UserFactory.create(
-        db_session,
-        email="admin_any_session@test.com",
-    )
     session = await CashSessionFactory.create(
         db_session,
-        business_id=business.id,
-        cashier_id=other_cashier.id,
+        business_id=shared_business.id,
+        cashier_id=shared_other_cashier.id,
         status="OPEN",
     )
 
     response = await admin_client.patch(
         f"/cash-sessions/{session.id}/edit-open",
-        json={"initial_cash": "1500.00"},
+        json=_EDIT_OPEN_BODY,
     )
 
     assert response.status_code == 200
@@ -1,149 +1,97 @@
 # File: tests/test_cashier_timeout.py
-import asyncio
+import copy
+import time
+from datetime import timedelta
 from types import SimpleNamespace
-from datetime import datetime, timedelta, timezone  # timezone is correctly imported
+from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
 
-from cashpilot.api.auth import get_current_user, ROLE_TIMEOUTS
+from cashpilot.api.auth import ROLE_TIMEOUTS, get_current_user
 from cashpilot.models.user import UserRole
-from tests.factories import UserFactory
-from cashpilot.core.security import hash_password
-
-# Import now_utc for timezone-aware datetimes in test setup
 from cashpilot.utils.datetime import now_utc
 
+# Shallow-copied per test; get_current_user never writes to the shared headers dict
+_TEMPLATE_REQUEST = SimpleNamespace(session=None, headers={})
+
+
+@pytest.fixture
+def user_for_role(monkeypatch, role):
+    """In-memory user for `role`, returned by get_current_user without a DB query.
+
+    These tests cover the timeout branch only, so the user lookup is stubbed out.
+    """
+    user = SimpleNamespace(id=uuid4(), role=role)
+
+    async def _load_user_by_id(user_id, db):
+        return user if user_id == user.id else None
+
+    monkeypatch.setattr("cashpilot.api.auth._load_user_by_id", _load_user_by_id)
+    return user
+
+
+@pytest.fixture
+def make_session():
+    """Build the request stand-in get_current_user reads the session from."""
+
+    def _make(user_id, role, last_activity):
+        request = copy.copy(_TEMPLATE_REQUEST)
+        request.session = {
+            "user_id": str(user_id),
+            "user_role": role,
+            "last_activity": last_activity,
+        }
+        return request
+
+    return _make
+
+
+@pytest.mark.parametrize("role", [UserRole.CASHIER, UserRole.ADMIN])
+@pytest.mark.parametrize("expired", [False, True])
+async def test_session_timeout(user_for_role, make_session, role, expired):
+    """AC-02: Active sessions are refreshed; sessions idle past the role timeout are terminated."""
+    timeout = ROLE_TIMEOUTS[role]
+    idle = timeout + 5 if expired else timeout // 2
+
+    request = make_session(user_for_role.id, role, int(time.time()) - idle)
+
+    if expired:
+        with pytest.raises(HTTPException) as excinfo:
+            await get_current_user(request, db=None)
+
+        exc = excinfo.value
+        assert exc.status_code == 303
+        assert exc.headers.get("Location") == "/login?expired=true"
+        assert request.session == {}
+        return
+
+    result_user = await get_current_user(request, db=None)
+    assert result_user.id == user_for_role.id
+    # Refreshed to the current epoch second
+    assert int(time.time()) - request.session["last_activity"] < 2
+
+
+@pytest.mark.parametrize("role", [UserRole.CASHIER])
+@pytest.mark.parametrize("expired", [False, True])
+async def test_session_timeout_accepts_legacy_iso_last_activity(
+    user_for_role, make_session, role, expired
+):
+    """Cookies issued before epoch timestamps carry ISO strings and are still honoured."""
+    timeout = ROLE_TIMEOUTS[role]
+    last_activity = now_utc() - timedelta(seconds=timeout + 5 if expired else timeout // 2)
+
+    request = make_session(user_for_role.id, role, last_activity.isoformat())
+
+    if expired:
+        with pytest.raises(HTTPException) as excinfo:
+            await get_current_user(request, db=None)
+
+        assert excinfo.value.status_code == 303
+        assert request.session == {}
+        return
 
-@pytest.mark.asyncio
-async def test_cashier_session_not_expired_updates_last_activity(db_session):
-    """AC-02: Cashier session activity is tracked for timeout enforcement."""
-    user = await UserFactory.create(
-        db_session,
-        email="cashier_timeout_ok@example.com",
-        first_name="Cashier",
-        last_name="User",
-        role="CASHIER",
-        hashed_password=hash_password("pass1234"),
-    )
-
-    cashier_timeout = ROLE_TIMEOUTS[UserRole.CASHIER]
-    # Use now_utc() for timezone-aware datetime
-    recent_aware = now_utc() - timedelta(seconds=cashier_timeout // 2)
-
-    request = SimpleNamespace(
-        session={
-            "user_id": str(user.id),
-            "user_role": UserRole.CASHIER,
-            "last_activity": recent_aware.isoformat(),
-        },
-        headers={},
-    )
-
-    result_user = await get_current_user(request, db=db_session)
-    assert result_user.id == user.id
-    assert "last_activity" in request.session
-
-    # The application now saves timezone-aware datetime in ISO format with timezone info
-    refreshed_aware = datetime.fromisoformat(request.session["last_activity"])
-
-    # Compare aware times
-    assert (datetime.now(timezone.utc) - refreshed_aware) < timedelta(seconds=2)
-
-
-@pytest.mark.asyncio
-async def test_cashier_session_expired_redirects_to_login(db_session):
-    """AC-02: Expired cashier sessions are terminated."""
-    user = await UserFactory.create(
-        db_session,
-        email="cashier_timeout_expired@example.com",
-        first_name="Cashier",
-        last_name="User",
-        role="CASHIER",
-        hashed_password=hash_password("pass1234"),
-    )
-
-    cashier_timeout = ROLE_TIMEOUTS[UserRole.CASHIER]
-    # Use now_utc() for timezone-aware datetime
-    old_aware = now_utc() - timedelta(seconds=cashier_timeout + 5)
-
-    session_store = {
-        "user_id": str(user.id),
-        "user_role": UserRole.CASHIER,
-        "last_activity": old_aware.isoformat(),
-    }
-    request = SimpleNamespace(session=session_store, headers={})
-
-    with pytest.raises(HTTPException) as excinfo:
-        await get_current_user(request, db=db_session)
-
-    exc = excinfo.value
-    assert exc.status_code == 303
-    assert exc.headers.get("Location") == "/login?expired=true"
-    assert request.session == {}
-
-
-@pytest.mark.asyncio
-async def test_admin_session_not_expired_updates_last_activity(db_session):
-    user = await UserFactory.create(
-        db_session,
-        email="admin_timeout_ok@example.com",
-        first_name="Admin",
-        last_name="User",
-        role="ADMIN",
-        hashed_password=hash_password("pass1234"),
-    )
-
-    admin_timeout = ROLE_TIMEOUTS[UserRole.ADMIN]
-    # Use now_utc() for timezone-aware datetime
-    recent_aware = now_utc() - timedelta(seconds=admin_timeout // 2)
-
-    request = SimpleNamespace(
-        session={
-            "user_id": str(user.id),
-            "user_role": UserRole.ADMIN,
-            "last_activity": recent_aware.isoformat(),
-        },
-        headers={},
-    )
-
-    result_user = await get_current_user(request, db=db_session)
-    assert result_user.id == user.id
-    assert "last_activity" in request.session
-
-    # The application now saves timezone-aware datetime in ISO format with timezone info
-    refreshed_aware = datetime.fromisoformat(request.session["last_activity"])
-
-    # Compare aware times
-    assert (datetime.now(timezone.utc) - refreshed_aware) < timedelta(seconds=2)
-
-
-@pytest.mark.asyncio
-async def test_admin_session_expired_redirects_to_login(db_session):
-    user = await UserFactory.create(
-        db_session,
-        email="admin_timeout_expired@example.com",
-        first_name="Admin",
-        last_name="User",
-        role="ADMIN",
-        hashed_password=hash_password("pass1234"),
-    )
-
-    admin_timeout = ROLE_TIMEOUTS[UserRole.ADMIN]
-    # Use now_utc() for timezone-aware datetime
-    old_aware = now_utc() - timedelta(seconds=admin_timeout + 5)
-
-    session_store = {
-        "user_id": str(user.id),
-        "user_role": UserRole.ADMIN,
-        "last_activity": old_aware.isoformat(),
-    }
-    request = SimpleNamespace(session=session_store, headers={})
-
-    with pytest.raises(HTTPException) as excinfo:
-        await get_current_user(request, db=db_session)
-
-    exc = excinfo.value
-    assert exc.status_code == 303
-    assert exc.headers.get("Location") == "/login?expired=true"
-    assert request.session == {}
+    result_user = await get_current_user(request, db=None)
+    assert result_user.id == user_for_role.id
+    # Rewritten in the new format on first use
+    assert isinstance(request.session["last_activity"], int)
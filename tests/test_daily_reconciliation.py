@@ -2,29 +2,115 @@
 """Tests for daily reconciliation endpoints."""
 
 import pytest
+import pytest_asyncio
 from decimal import Decimal
-from datetime import date
+from datetime import date, timedelta
+from urllib.parse import urlencode
 from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cashpilot.models.business import Business
 from cashpilot.models.daily_reconciliation import DailyReconciliation
-from cashpilot.models.daily_reconciliation_audit_log import DailyReconciliationAuditLog
+from cashpilot.utils.datetime import now_utc, today_local
 from tests.factories import BusinessFactory, DailyReconciliationFactory, CashSessionFactory
-
-
+from tests.helpers import count_audit_logs, fetch_audit_logs_by_ids, fetch_fields
+
+# Amounts (Gs) reused across tests, parsed once at import
+_GS_0 = Decimal("0.00")
+_GS_200 = Decimal("200.00")
+_GS_500 = Decimal("500.00")
+_GS_1K = Decimal("1000.00")
+_GS_1_5K = Decimal("1500.00")
+_GS_200K = Decimal("200000.00")
+_GS_500K = Decimal("500000.00")
+_GS_1M = Decimal("1000000.00")
+_GS_1_7M = Decimal("1700000.00")
+
+# Fixed form bodies, url-encoded once at import; dynamic bodies still use data=
+_FORM_HEADERS = {"content-type": "application/x-www-form-urlencoded"}
+_DATE_BODY = urlencode({"date": "2024-01-01"}).encode()
+_REASON_BODY = urlencode({"reason": "Test reason"}).encode()
+_SHORT_REASON_BODY = urlencode({"reason": "abc"}).encode()
+_DELETION_REASON_BODY = urlencode({"reason": "Test deletion reason"}).encode()
+_DELETION_BODY = urlencode({"reason": "Test deletion"}).encode()
+
+
+@pytest.fixture(scope="module")
+def today() -> date:
+    """Business-local today, computed once for the module.
+
+    Tests take their dates from here rather than freezing the clock: the
+    clients' session cookies are signed with the real time, and a clock frozen
+    in the past would make every one of them fail to unsign.
+    """
+    return today_local()
+
+
+@pytest.fixture(scope="module")
+def today_str(today: date) -> str:
+    """ISO form of ``today`` for form fields and query strings."""
+    return today.isoformat()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_inactive_business(module_db_session: AsyncSession) -> Business:
+    """Business created once per module for tests that only edit or delete a reconciliation.
+
+    It is inactive, so it never shows up in the compare results the other tests count.
+    PUT and DELETE look reconciliations up by id and don't care about the business.
+    """
+    return await BusinessFactory.create(
+        module_db_session, name="Shared Inactive Business", is_active=False
+    )
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_reconciliation(
+    module_db_session: AsyncSession, shared_inactive_business: Business
+) -> DailyReconciliation:
+    """Reconciliation created once per module for requests rejected before any lookup.
+
+    Its date is long past, so it never shows up in the date-filtered GET results
+    the other tests count.
+    """
+    return await DailyReconciliationFactory.create(
+        module_db_session, business_id=shared_inactive_business.id, date=date(2000, 1, 1)
+    )
+
+
+@pytest.mark.sqlite
 class TestDailyReconciliationAdminAccess:
     """Test admin-only access to daily reconciliation endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_get_form_requires_admin(
-        self, client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test non-admin users cannot access the form."""
-        response = await client.get("/reconciliation/daily", follow_redirects=False)
+    @pytest.mark.parametrize(
+        "method, path, body",
+        [
+            pytest.param("GET", "/reconciliation/daily", None, id="get-form"),
+            pytest.param("POST", "/reconciliation/daily", _DATE_BODY, id="post"),
+            pytest.param("GET", "/reconciliation/daily/", None, id="get-api"),
+            pytest.param("PUT", "/reconciliation/daily/{id}", _REASON_BODY, id="put"),
+            pytest.param("DELETE", "/reconciliation/daily/{id}", _REASON_BODY, id="delete"),
+        ],
+    )
+    async def test_non_admin_denied(
+        self,
+        client: AsyncClient,
+        shared_reconciliation: DailyReconciliation,
+        method: str,
+        path: str,
+        body: bytes | None,
+    ):
+        """Test non-admin users cannot reach any daily reconciliation endpoint."""
+        response = await client.request(
+            method,
+            path.format(id=shared_reconciliation.id),
+            content=body,
+            headers=_FORM_HEADERS if body is not None else None,
+            follow_redirects=False,
+        )
         assert response.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_get_form_allows_admin(
         self, admin_client: AsyncClient, db_session: AsyncSession
     ):
@@ -32,123 +118,43 @@ class TestDailyReconciliationAdminAccess:
         response = await admin_client.get("/reconciliation/daily")
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
-    async def test_post_requires_admin(
-        self, client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test non-admin users cannot POST to create reconciliation."""
-        response = await client.post(
-            "/reconciliation/daily",
-            data={"date": "2024-01-01"},
-            follow_redirects=False,
-        )
-        assert response.status_code == 403
-
-    @pytest.mark.asyncio
-    async def test_get_api_requires_admin(
-        self, client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test non-admin users cannot access GET API endpoint."""
-        response = await client.get("/reconciliation/daily/", follow_redirects=False)
-        assert response.status_code == 403
-
-    @pytest.mark.asyncio
-    async def test_put_requires_admin(
-        self, client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test non-admin users cannot PUT to update reconciliation."""
-        business = await BusinessFactory.create(db_session)
-        reconciliation = await DailyReconciliationFactory.create(
-            db_session, business_id=business.id
-        )
-
-        response = await client.put(
-            f"/reconciliation/daily/{reconciliation.id}",
-            data={"reason": "Test reason"},  # type: ignore[arg-type]
-            follow_redirects=False,
-        )
-        assert response.status_code == 403
-
-    @pytest.mark.asyncio
-    async def test_delete_requires_admin(
-        self, client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test non-admin users cannot DELETE reconciliation."""
-        business = await BusinessFactory.create(db_session)
-        reconciliation = await DailyReconciliationFactory.create(
-            db_session, business_id=business.id
-        )
-
-        response = await client.request(
-            "DELETE",
-            f"/reconciliation/daily/{reconciliation.id}",
-            data={"reason": "Test reason"},
-            follow_redirects=False,
-        )
-        assert response.status_code == 403
-
 
+@pytest.mark.sqlite
 class TestDailyReconciliationSchemaValidation:
     """Test schema validation for daily reconciliation."""
 
-    @pytest.mark.asyncio
-    async def test_post_validates_date_not_future(
-        self, admin_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test POST rejects future dates."""
-        from datetime import timedelta
-
-        future_date = (date.today() + timedelta(days=1)).isoformat()
-        response = await admin_client.post(
-            "/reconciliation/daily",
-            data={"date": future_date},
-            follow_redirects=False,
-        )
-        assert response.status_code == 400
-
-    @pytest.mark.asyncio
-    async def test_post_validates_date_format(
-        self, admin_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test POST rejects invalid date format."""
+    @pytest.mark.parametrize(
+        "make_date",
+        [
+            pytest.param(lambda today: (today + timedelta(days=1)).isoformat(), id="future"),
+            pytest.param(lambda today: "invalid-date", id="bad-format"),
+        ],
+    )
+    async def test_post_rejects_invalid_date(
+        self, admin_client: AsyncClient, today: date, make_date
+    ):
+        """Test POST rejects future dates and malformed dates."""
+        # Built at run time from the today fixture, not at collection time
         response = await admin_client.post(
             "/reconciliation/daily",
-            data={"date": "invalid-date"},
+            data={"date": make_date(today)},
             follow_redirects=False,
         )
         assert response.status_code == 400
 
-    @pytest.mark.asyncio
-    async def test_put_requires_reason_min_length(
-        self, admin_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test PUT requires reason with minimum length."""
-        business = await BusinessFactory.create(db_session)
-        reconciliation = await DailyReconciliationFactory.create(
-            db_session, business_id=business.id
-        )
-
-        response = await admin_client.put(
-            f"/reconciliation/daily/{reconciliation.id}",
-            data={"reason": "abc"},  # type: ignore[arg-type]  # Too short
-            follow_redirects=False,
-        )
-        assert response.status_code == 422  # Validation error
-
-    @pytest.mark.asyncio
-    async def test_delete_requires_reason_min_length(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+    @pytest.mark.parametrize("method", ["PUT", "DELETE"])
+    async def test_reason_requires_min_length(
+        self,
+        admin_client: AsyncClient,
+        shared_reconciliation: DailyReconciliation,
+        method: str,
     ):
-        """Test DELETE requires reason with minimum length."""
-        business = await BusinessFactory.create(db_session)
-        reconciliation = await DailyReconciliationFactory.create(
-            db_session, business_id=business.id
-        )
-
+        """Test PUT and DELETE require a reason with minimum length."""
         response = await admin_client.request(
-            "DELETE",
-            f"/reconciliation/daily/{reconciliation.id}",
-            data={"reason": "abc"},  # Too short
+            method,
+            f"/reconciliation/daily/{shared_reconciliation.id}",
+            content=_SHORT_REASON_BODY,  # Too short
+            headers=_FORM_HEADERS,
             follow_redirects=False,
         )
         assert response.status_code == 422  # Validation error
@@ -157,62 +163,66 @@ class TestDailyReconciliationSchemaValidation:
 class TestDailyReconciliationSoftDelete:
     """Test soft delete functionality."""
 
-    @pytest.mark.asyncio
     async def test_delete_sets_deleted_at(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        shared_inactive_business: Business,
     ):
         """Test DELETE sets deleted_at timestamp."""
-        business = await BusinessFactory.create(db_session)
         reconciliation = await DailyReconciliationFactory.create(
-            db_session, business_id=business.id
+            db_session, business_id=shared_inactive_business.id
         )
 
         response = await admin_client.request(
             "DELETE",
             f"/reconciliation/daily/{reconciliation.id}",
-            data={"reason": "Test deletion reason"},
+            content=_DELETION_REASON_BODY,
+            headers=_FORM_HEADERS,
             follow_redirects=False,
         )
         assert response.status_code == 204
 
-        await db_session.refresh(reconciliation)
-        assert reconciliation.deleted_at is not None
-        assert reconciliation.deleted_by is not None
+        deleted_at, deleted_by = await fetch_fields(
+            db_session,
+            DailyReconciliation,
+            reconciliation.id,
+            DailyReconciliation.deleted_at,
+            DailyReconciliation.deleted_by,
+        )
+        assert deleted_at is not None
+        assert deleted_by is not None
 
-    @pytest.mark.asyncio
     async def test_delete_creates_audit_log(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        shared_inactive_business: Business,
     ):
         """Test DELETE creates audit log entry."""
-        business = await BusinessFactory.create(db_session)
         reconciliation = await DailyReconciliationFactory.create(
             db_session,
-            business_id=business.id,
-            cash_sales=Decimal("1000000.00"),
-            credit_sales=Decimal("500000.00"),
+            business_id=shared_inactive_business.id,
+            cash_sales=_GS_1M,
+            credit_sales=_GS_500K,
         )
 
         response = await admin_client.request(
             "DELETE",
             f"/reconciliation/daily/{reconciliation.id}",
-            data={"reason": "Test deletion reason"},
+            content=_DELETION_REASON_BODY,
+            headers=_FORM_HEADERS,
             follow_redirects=False,
         )
         assert response.status_code == 204
 
         # Check audit log was created
-        stmt = select(DailyReconciliationAuditLog).where(
-            DailyReconciliationAuditLog.reconciliation_id == reconciliation.id,
-            DailyReconciliationAuditLog.action == "DELETE",
-        )
-        result = await db_session.execute(stmt)
-        audit_log = result.scalar_one_or_none()
+        logs = await fetch_audit_logs_by_ids(db_session, [reconciliation.id])
+        (audit_log,) = [log for log in logs[reconciliation.id] if log.action == "DELETE"]
 
-        assert audit_log is not None
         assert audit_log.reason == "Test deletion reason"
         assert audit_log.action == "DELETE"
 
-    @pytest.mark.asyncio
     async def test_deleted_reconciliation_not_in_get(
         self, admin_client: AsyncClient, db_session: AsyncSession
     ):
@@ -226,37 +236,37 @@ class TestDailyReconciliationSoftDelete:
         await admin_client.request(
             "DELETE",
             f"/reconciliation/daily/{reconciliation.id}",
-            data={"reason": "Test deletion"},
+            content=_DELETION_BODY,
+            headers=_FORM_HEADERS,
         )
 
-        # Get all reconciliations
-        response = await admin_client.get("/reconciliation/daily/")
+        # The business's only reconciliation is gone from its filtered list
+        response = await admin_client.get(f"/reconciliation/daily/?business_id={business.id}")
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 0 or str(reconciliation.id) not in [r["id"] for r in data]
+        assert response.json() == []
 
-    @pytest.mark.asyncio
     async def test_cannot_delete_already_deleted(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        shared_inactive_business: Business,
     ):
         """Test cannot delete an already deleted reconciliation."""
-        from cashpilot.utils.datetime import now_utc
-
-        business = await BusinessFactory.create(db_session)
         reconciliation = await DailyReconciliationFactory.create(
-            db_session, business_id=business.id
+            db_session, business_id=shared_inactive_business.id
         )
 
         # Manually soft delete it
         reconciliation.deleted_at = now_utc()
         reconciliation.deleted_by = "Test User"
-        await db_session.commit()
+        await db_session.flush()
 
         # Try to delete again
         response = await admin_client.request(
             "DELETE",
             f"/reconciliation/daily/{reconciliation.id}",
-            data={"reason": "Test deletion"},
+            content=_DELETION_BODY,
+            headers=_FORM_HEADERS,
             follow_redirects=False,
         )
         assert response.status_code == 404
@@ -265,17 +275,16 @@ class TestDailyReconciliationSoftDelete:
 class TestDailyReconciliationIsClosed:
     """Test is_closed flag functionality."""
 
-    @pytest.mark.asyncio
     async def test_is_closed_allows_null_sales_fields(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test when is_closed=true, sales fields can be null."""
-        from cashpilot.utils.datetime import today_local
-
         business = await BusinessFactory.create(db_session)
         business_id = business.id  # Capture ID before async operations
-        today = today_local()
-        today_str = today.isoformat()
 
         response = await admin_client.post(
             "/reconciliation/daily",
@@ -301,17 +310,16 @@ class TestDailyReconciliationIsClosed:
         assert reconciliation.cash_sales is None
         assert reconciliation.card_sales is None
 
-    @pytest.mark.asyncio
     async def test_is_closed_false_requires_sales_data(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test when is_closed=false, sales data is required."""
-        from cashpilot.utils.datetime import today_local
-
         business = await BusinessFactory.create(db_session)
         business_id = business.id  # Capture ID before async operations
-        today = today_local()
-        today_str = today.isoformat()
 
         # Create without is_closed (defaults to False) and no sales data
         response = await admin_client.post(
@@ -335,17 +343,18 @@ class TestDailyReconciliationIsClosed:
 
         assert reconciliation is None  # Should not be created
 
-    @pytest.mark.asyncio
     async def test_update_is_closed_flag(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        shared_inactive_business: Business,
     ):
         """Test updating is_closed flag via PUT."""
-        business = await BusinessFactory.create(db_session)
         reconciliation = await DailyReconciliationFactory.create(
             db_session,
-            business_id=business.id,
+            business_id=shared_inactive_business.id,
             is_closed=False,
-            cash_sales=Decimal("1000000.00"),
+            cash_sales=_GS_1M,
         )
 
         response = await admin_client.put(
@@ -357,21 +366,19 @@ class TestDailyReconciliationIsClosed:
             follow_redirects=False,
         )
         assert response.status_code == 200
+        # The PUT returns the saved row, committed before the response is built
+        assert response.json()["is_closed"] is True
 
-        await db_session.refresh(reconciliation)
-        assert reconciliation.is_closed is True
-
-    @pytest.mark.asyncio
     async def test_update_is_closed_preserves_sales_data(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test that updating is_closed=True via POST preserves existing sales data."""
-        from cashpilot.utils.datetime import today_local
-
         business = await BusinessFactory.create(db_session)
         business_id = business.id
-        today = today_local()
-        today_str = today.isoformat()
 
         # Create reconciliation with sales data
         # Use the same date as the POST request to ensure we update, not create
@@ -380,10 +387,10 @@ class TestDailyReconciliationIsClosed:
             business_id=business_id,
             date=today,  # Explicitly set date to match POST request
             is_closed=False,
-            cash_sales=Decimal("1000000.00"),
-            credit_sales=Decimal("500000.00"),
-            card_sales=Decimal("200000.00"),
-            total_sales=Decimal("1700000.00"),
+            cash_sales=_GS_1M,
+            credit_sales=_GS_500K,
+            card_sales=_GS_200K,
+            total_sales=_GS_1_7M,
         )
 
         # Update via POST with is_closed=True (no sales fields in form)
@@ -399,27 +406,37 @@ class TestDailyReconciliationIsClosed:
         assert response.status_code == 302  # Should succeed
 
         # Verify sales data is preserved
-        await db_session.refresh(reconciliation)
-        assert reconciliation.is_closed is True
-        assert reconciliation.cash_sales == Decimal("1000000.00")
-        assert reconciliation.credit_sales == Decimal("500000.00")
-        assert reconciliation.card_sales == Decimal("200000.00")
-        assert reconciliation.total_sales == Decimal("1700000.00")
+        is_closed, cash_sales, credit_sales, card_sales, total_sales = await fetch_fields(
+            db_session,
+            DailyReconciliation,
+            reconciliation.id,
+            DailyReconciliation.is_closed,
+            DailyReconciliation.cash_sales,
+            DailyReconciliation.credit_sales,
+            DailyReconciliation.card_sales,
+            DailyReconciliation.total_sales,
+        )
+        assert is_closed is True
+        assert cash_sales == _GS_1M
+        assert credit_sales == _GS_500K
+        assert card_sales == _GS_200K
+        assert total_sales == _GS_1_7M
 
 
 class TestDailyReconciliationEditAuditTrail:
     """Test audit trail for edits."""
 
-    @pytest.mark.asyncio
     async def test_edit_creates_audit_log(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        shared_inactive_business: Business,
     ):
         """Test editing creates audit log entry."""
-        business = await BusinessFactory.create(db_session)
         reconciliation = await DailyReconciliationFactory.create(
             db_session,
-            business_id=business.id,
-            cash_sales=Decimal("1000000.00"),
+            business_id=shared_inactive_business.id,
+            cash_sales=_GS_1M,
         )
 
         response = await admin_client.put(
@@ -433,28 +450,24 @@ class TestDailyReconciliationEditAuditTrail:
         assert response.status_code == 200
 
         # Check audit log was created
-        stmt = select(DailyReconciliationAuditLog).where(
-            DailyReconciliationAuditLog.reconciliation_id == reconciliation.id,
-            DailyReconciliationAuditLog.action == "EDIT",
-        )
-        result = await db_session.execute(stmt)
-        audit_log = result.scalar_one_or_none()
+        logs = await fetch_audit_logs_by_ids(db_session, [reconciliation.id])
+        (audit_log,) = [log for log in logs[reconciliation.id] if log.action == "EDIT"]
 
-        assert audit_log is not None
         assert audit_log.reason == "Corrected cash sales amount"
         assert audit_log.action == "EDIT"
         assert "cash_sales" in audit_log.changed_fields
 
-    @pytest.mark.asyncio
     async def test_edit_tracks_old_and_new_values(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        shared_inactive_business: Business,
     ):
         """Test audit log tracks old and new values."""
-        business = await BusinessFactory.create(db_session)
         reconciliation = await DailyReconciliationFactory.create(
             db_session,
-            business_id=business.id,
-            cash_sales=Decimal("1000000.00"),
+            business_id=shared_inactive_business.id,
+            cash_sales=_GS_1M,
         )
 
         response = await admin_client.put(
@@ -468,26 +481,23 @@ class TestDailyReconciliationEditAuditTrail:
         assert response.status_code == 200
 
         # Check audit log
-        stmt = select(DailyReconciliationAuditLog).where(
-            DailyReconciliationAuditLog.reconciliation_id == reconciliation.id
-        )
-        result = await db_session.execute(stmt)
-        audit_log = result.scalar_one_or_none()
+        logs = await fetch_audit_logs_by_ids(db_session, [reconciliation.id])
+        (audit_log,) = logs[reconciliation.id]
 
-        assert audit_log is not None
         assert audit_log.old_values.get("cash_sales") == "1000000.00"
         assert audit_log.new_values.get("cash_sales") == "2000000.00"
 
-    @pytest.mark.asyncio
     async def test_no_audit_log_if_no_changes(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        shared_inactive_business: Business,
     ):
         """Test no audit log created if no fields actually changed."""
-        business = await BusinessFactory.create(db_session)
         reconciliation = await DailyReconciliationFactory.create(
             db_session,
-            business_id=business.id,
-            cash_sales=Decimal("1000000.00"),
+            business_id=shared_inactive_business.id,
+            cash_sales=_GS_1M,
         )
 
         # Update with same value
@@ -501,54 +511,42 @@ class TestDailyReconciliationEditAuditTrail:
         )
         assert response.status_code == 200
 
-        # Check no audit log was created (or it was skipped)
-        stmt = select(DailyReconciliationAuditLog).where(
-            DailyReconciliationAuditLog.reconciliation_id == reconciliation.id
-        )
-        result = await db_session.execute(stmt)
-        audit_logs = result.scalars().all()
-
         # Should have no audit logs (or the function should skip creating one)
         # The implementation skips if no fields changed, so this is expected
-        assert len(audit_logs) == 0
+        assert await count_audit_logs(db_session, reconciliation.id) == 0
 
 
 class TestDailyReconciliationGetAPI:
     """Test GET API endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_all_reconciliations(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+    async def test_get_api_filters(
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
-        """Test GET returns all reconciliations."""
-        business1 = await BusinessFactory.create(db_session, name="Business 1")
-        business2 = await BusinessFactory.create(db_session, name="Business 2")
-
-        await DailyReconciliationFactory.create(
-            db_session, business_id=business1.id, date=date.today()
+        """Test GET returns all reconciliations and filters by business_id and date."""
+        business1, business2 = await BusinessFactory.create_many(
+            db_session, [{"name": "Business 1"}, {"name": "Business 2"}]
         )
-        await DailyReconciliationFactory.create(
-            db_session, business_id=business2.id, date=date.today()
+        yesterday = today - timedelta(days=1)
+
+        # One row per business, on different days, so each filter keeps exactly one
+        await DailyReconciliationFactory.create_many(
+            db_session,
+            [
+                {"business_id": business1.id, "date": today},
+                {"business_id": business2.id, "date": yesterday},
+            ],
         )
 
+        # All reconciliations
         response = await admin_client.get("/reconciliation/daily/")
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) >= 2
-
-    @pytest.mark.asyncio
-    async def test_get_filter_by_business_id(
-        self, admin_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test GET filters by business_id."""
-        business1 = await BusinessFactory.create(db_session)
-        business2 = await BusinessFactory.create(db_session)
-
-        await DailyReconciliationFactory.create(
-            db_session, business_id=business1.id
-        )
-        await DailyReconciliationFactory.create(db_session, business_id=business2.id)
+        assert len(response.json()) >= 2
 
+        # Filtered by business_id
         response = await admin_client.get(
             f"/reconciliation/daily/?business_id={business1.id}"
         )
@@ -557,50 +555,33 @@ class TestDailyReconciliationGetAPI:
         assert len(data) == 1
         assert data[0]["business_id"] == str(business1.id)
 
-    @pytest.mark.asyncio
-    async def test_get_filter_by_date(
-        self, admin_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test GET filters by date."""
-        from datetime import timedelta
-
-        business = await BusinessFactory.create(db_session)
-        today = date.today()
-        yesterday = today - timedelta(days=1)
-
-        await DailyReconciliationFactory.create(
-            db_session, business_id=business.id, date=today
-        )
-        await DailyReconciliationFactory.create(
-            db_session, business_id=business.id, date=yesterday
-        )
-
-        response = await admin_client.get(f"/reconciliation/daily/?date={today.isoformat()}")
+        # Filtered by date
+        response = await admin_client.get(f"/reconciliation/daily/?date={today_str}")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
-        assert data[0]["date"] == today.isoformat()
+        assert data[0]["date"] == today_str
 
 
 class TestReconciliationCompare:
     """Test reconciliation comparison endpoint with variance calculation."""
 
-    @pytest.mark.asyncio
     async def test_compare_variance_calculation(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test variance calculation is correct."""
-        from datetime import date
-
         business = await BusinessFactory.create(db_session)
-        today = date.today()
 
         # Create manual entry
         await DailyReconciliationFactory.create(
             db_session,
             business_id=business.id,
             date=today,
-            total_sales=Decimal("1000.00"),
+            total_sales=_GS_1K,
         )
 
         # Create cash session with calculated total = 1050.00
@@ -612,12 +593,12 @@ class TestReconciliationCompare:
             business_id=business.id,
             session_date=today,
             status="CLOSED",
-            initial_cash=Decimal("200.00"),
+            initial_cash=_GS_200,
             final_cash=Decimal("1200.00"),
             card_total=Decimal("50.00"),
         )
 
-        response = await admin_client.get(f"/reconciliation/compare/?date={today.isoformat()}")
+        response = await admin_client.get(f"/reconciliation/compare/?date={today_str}")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
@@ -631,15 +612,15 @@ class TestReconciliationCompare:
         assert abs(item["variance"]["total_sales"]["variance_percent"] - (-4.76)) < 0.1
         assert item["status"] == "Needs Review"  # > 2% threshold
 
-    @pytest.mark.asyncio
     async def test_compare_multiple_sessions_same_day(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test that multiple sessions on same day are summed correctly."""
-        from datetime import date
-
         business = await BusinessFactory.create(db_session)
-        today = date.today()
 
         # Create manual entry
         await DailyReconciliationFactory.create(
@@ -649,29 +630,31 @@ class TestReconciliationCompare:
             total_sales=Decimal("3000.00"),
         )
 
-        # Session 1: Cash 1000, Card 500 = 1500 total
-        await CashSessionFactory.create(
-            db_session,
-            business_id=business.id,
-            session_date=today,
-            status="CLOSED",
-            initial_cash=Decimal("500.00"),
-            final_cash=Decimal("1500.00"),  # Cash sales = 1000
-            card_total=Decimal("500.00"),
-        )
-
-        # Session 2: Cash 800, Card 700 = 1500 total
-        await CashSessionFactory.create(
+        await CashSessionFactory.create_many(
             db_session,
-            business_id=business.id,
-            session_date=today,
-            status="CLOSED",
-            initial_cash=Decimal("200.00"),
-            final_cash=Decimal("1000.00"),  # Cash sales = 800
-            card_total=Decimal("700.00"),
-        )
-
-        response = await admin_client.get(f"/reconciliation/compare/?date={today.isoformat()}")
+            [
+                # Session 1: Cash 1000, Card 500 = 1500 total
+                {
+                    "business_id": business.id,
+                    "session_date": today,
+                    "status": "CLOSED",
+                    "initial_cash": _GS_500,
+                    "final_cash": _GS_1_5K,  # Cash sales = 1000
+                    "card_total": _GS_500,
+                },
+                # Session 2: Cash 800, Card 700 = 1500 total
+                {
+                    "business_id": business.id,
+                    "session_date": today,
+                    "status": "CLOSED",
+                    "initial_cash": _GS_200,
+                    "final_cash": _GS_1K,  # Cash sales = 800
+                    "card_total": Decimal("700.00"),
+                },
+            ],
+        )
+
+        response = await admin_client.get(f"/reconciliation/compare/?date={today_str}")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
@@ -684,22 +667,22 @@ class TestReconciliationCompare:
         assert item["variance"]["total_sales"]["variance_percent"] == 0.0
         assert item["status"] == "Match"
 
-    @pytest.mark.asyncio
     async def test_compare_edge_case_zero_sales(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test edge case with 0 sales."""
-        from datetime import date
-
         business = await BusinessFactory.create(db_session)
-        today = date.today()
 
         # Create manual entry with 0 sales
         await DailyReconciliationFactory.create(
             db_session,
             business_id=business.id,
             date=today,
-            total_sales=Decimal("0.00"),
+            total_sales=_GS_0,
         )
 
         # Create cash session with 0 sales
@@ -708,12 +691,12 @@ class TestReconciliationCompare:
             business_id=business.id,
             session_date=today,
             status="CLOSED",
-            initial_cash=Decimal("500.00"),
-            final_cash=Decimal("500.00"),  # No cash sales
-            card_total=Decimal("0.00"),
+            initial_cash=_GS_500,
+            final_cash=_GS_500,  # No cash sales
+            card_total=_GS_0,
         )
 
-        response = await admin_client.get(f"/reconciliation/compare/?date={today.isoformat()}")
+        response = await admin_client.get(f"/reconciliation/compare/?date={today_str}")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
@@ -725,15 +708,15 @@ class TestReconciliationCompare:
         assert item["variance"]["total_sales"]["variance_percent"] is None
         assert item["status"] == "Match"
 
-    @pytest.mark.asyncio
     async def test_compare_no_manual_entry(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test comparison when no manual entry exists."""
-        from datetime import date
-
         business = await BusinessFactory.create(db_session)
-        today = date.today()
 
         # Create cash session but no manual entry
         await CashSessionFactory.create(
@@ -741,12 +724,12 @@ class TestReconciliationCompare:
             business_id=business.id,
             session_date=today,
             status="CLOSED",
-            initial_cash=Decimal("500.00"),
-            final_cash=Decimal("1500.00"),
-            card_total=Decimal("200.00"),
+            initial_cash=_GS_500,
+            final_cash=_GS_1_5K,
+            card_total=_GS_200,
         )
 
-        response = await admin_client.get(f"/reconciliation/compare/?date={today.isoformat()}")
+        response = await admin_client.get(f"/reconciliation/compare/?date={today_str}")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
@@ -758,22 +741,22 @@ class TestReconciliationCompare:
         assert item["variance"]["total_sales"]["variance_percent"] is None
         assert item["status"] == "Match"
 
-    @pytest.mark.asyncio
     async def test_compare_variance_threshold_match(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test that variance <= 2% shows as Match."""
-        from datetime import date
-
         business = await BusinessFactory.create(db_session)
-        today = date.today()
 
         # Manual: 1000, Calculated: 1015 (1.5% variance)
         await DailyReconciliationFactory.create(
             db_session,
             business_id=business.id,
             date=today,
-            total_sales=Decimal("1000.00"),
+            total_sales=_GS_1K,
         )
 
         # Calculated total should be ~1015 (1.5% difference)
@@ -783,12 +766,12 @@ class TestReconciliationCompare:
             business_id=business.id,
             session_date=today,
             status="CLOSED",
-            initial_cash=Decimal("200.00"),
+            initial_cash=_GS_200,
             final_cash=Decimal("1215.00"),  # Cash sales = 1015
-            card_total=Decimal("0.00"),
+            card_total=_GS_0,
         )
 
-        response = await admin_client.get(f"/reconciliation/compare/?date={today.isoformat()}")
+        response = await admin_client.get(f"/reconciliation/compare/?date={today_str}")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
@@ -799,15 +782,15 @@ class TestReconciliationCompare:
         assert abs(variance_pct - (-1.48)) < 0.1  # ~-1.48%
         assert item["status"] == "Match"  # <= 2% threshold and < 20,000 Gs absolute
 
-    @pytest.mark.asyncio
     async def test_compare_absolute_threshold_exceeds_20k(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test that absolute difference > 20,000 Gs flags as Needs Review even if % < 2%."""
-        from datetime import date
-
         business = await BusinessFactory.create(db_session)
-        today = date.today()
 
         # Manual: 1,000,000, Calculated: 1,025,000 (2.5% variance, but 25,000 Gs absolute)
         # This should trigger "Needs Review" because absolute > 20,000 Gs
@@ -815,7 +798,7 @@ class TestReconciliationCompare:
             db_session,
             business_id=business.id,
             date=today,
-            total_sales=Decimal("1000000.00"),  # 1M Gs
+            total_sales=_GS_1M,  # 1M Gs
         )
 
         # Calculated total: 1,025,000 (25,000 Gs difference, 2.44% variance)
@@ -824,12 +807,12 @@ class TestReconciliationCompare:
             business_id=business.id,
             session_date=today,
             status="CLOSED",
-            initial_cash=Decimal("0.00"),
+            initial_cash=_GS_0,
             final_cash=Decimal("1025000.00"),  # Cash sales = 1,025,000
-            card_total=Decimal("0.00"),
+            card_total=_GS_0,
         )
 
-        response = await admin_client.get(f"/reconciliation/compare/?date={today.isoformat()}")
+        response = await admin_client.get(f"/reconciliation/compare/?date={today_str}")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
@@ -841,15 +824,15 @@ class TestReconciliationCompare:
         # Should be "Needs Review" because absolute difference (25,000) > 20,000 Gs
         assert item["status"] == "Needs Review"
 
-    @pytest.mark.asyncio
     async def test_compare_absolute_threshold_within_20k(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test that absolute difference < 20,000 Gs and % < 2% shows as Match."""
-        from datetime import date
-
         business = await BusinessFactory.create(db_session)
-        today = date.today()
 
         # Manual: 1,000,000, Calculated: 1,015,000 (1.5% variance, 15,000 Gs absolute)
         # This should be "Match" because both thresholds are within limits
@@ -857,7 +840,7 @@ class TestReconciliationCompare:
             db_session,
             business_id=business.id,
             date=today,
-            total_sales=Decimal("1000000.00"),  # 1M Gs
+            total_sales=_GS_1M,  # 1M Gs
         )
 
         # Calculated total: 1,015,000 (15,000 Gs difference, 1.48% variance)
@@ -866,12 +849,12 @@ class TestReconciliationCompare:
             business_id=business.id,
             session_date=today,
             status="CLOSED",
-            initial_cash=Decimal("0.00"),
+            initial_cash=_GS_0,
             final_cash=Decimal("1015000.00"),  # Cash sales = 1,015,000
-            card_total=Decimal("0.00"),
+            card_total=_GS_0,
         )
 
-        response = await admin_client.get(f"/reconciliation/compare/?date={today.isoformat()}")
+        response = await admin_client.get(f"/reconciliation/compare/?date={today_str}")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
@@ -883,26 +866,26 @@ class TestReconciliationCompare:
         # Should be "Match" because both absolute (15,000) < 20,000 Gs and % (1.48%) < 2%
         assert item["status"] == "Match"
 
-    @pytest.mark.asyncio
     async def test_compare_filter_by_business_id(
-        self, admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        admin_client: AsyncClient,
+        db_session: AsyncSession,
+        today: date,
+        today_str: str,
     ):
         """Test filtering by business_id."""
-        from datetime import date
+        business1, business2 = await BusinessFactory.create_many(db_session, [{}, {}])
 
-        business1 = await BusinessFactory.create(db_session)
-        business2 = await BusinessFactory.create(db_session)
-        today = date.today()
-
-        await DailyReconciliationFactory.create(
-            db_session, business_id=business1.id, date=today
-        )
-        await DailyReconciliationFactory.create(
-            db_session, business_id=business2.id, date=today
+        await DailyReconciliationFactory.create_many(
+            db_session,
+            [
+                {"business_id": business1.id, "date": today},
+                {"business_id": business2.id, "date": today},
+            ],
         )
 
         response = await admin_client.get(
-            f"/reconciliation/compare/?date={today.isoformat()}&business_id={business1.id}"
+            f"/reconciliation/compare/?date={today_str}&business_id={business1.id}"
         )
         assert response.status_code == 200
         data = response.json()
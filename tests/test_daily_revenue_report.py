@@ -1,29 +1,15 @@
 """Tests for the Daily Revenue Summary Report."""
 
-from datetime import date, time, timedelta
+from datetime import date, time
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cashpilot.main import create_app
 from cashpilot.models import Business, CashSession, User, UserRole
 
 
-@pytest.fixture
-def app():
-    """Create FastAPI app for testing."""
-    return create_app()
-
-
-@pytest.fixture
-def client(app):
-    """Create test client."""
-    return TestClient(app)
-
-
 @pytest.fixture
 async def setup_test_data(db_session: AsyncSession):
     """Create test business and user with sample sessions."""
@@ -163,8 +149,6 @@ class TestDailyRevenueEndpoint:
     @pytest.mark.asyncio
     async def test_aggregation_calculation(self, db_session: AsyncSession, setup_test_data):
         """Test that sales aggregation is calculated correctly."""
-        from cashpilot.api.daily_revenue import get_daily_revenue
-        
         data = setup_test_data
         
         # Verify sessions were created
@@ -326,7 +310,7 @@ class TestAcceptanceCriteria:
         assert summary.shortage_count == 1
         assert summary.surplus_count == 1
     
-    def test_html_dashboard_exists(self, client):
+    def test_html_dashboard_exists(self):
         """Criterion: HTML dashboard displays data with DaisyUI formatting."""
         # Template file should exist with proper formatting
         import os
@@ -3,7 +3,7 @@
 """Tests for cash session date validation."""
 
 import pytest
-from datetime import date, datetime, time, timedelta
+from datetime import date, time, timedelta
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -4,12 +4,11 @@
 
 import pytest
 from decimal import Decimal
-from datetime import date, datetime, time, timedelta
+from datetime import date, timedelta
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cashpilot.models.cash_session import CashSession
 from cashpilot.models.cash_session_audit_log import CashSessionAuditLog
 from cashpilot.models.user_business import UserBusiness
 from tests.factories import BusinessFactory, CashSessionFactory
@@ -283,13 +282,14 @@ class TestEditOpenSessionAuditLogging:
             follow_redirects=False,
         )
 
-        stmt = select(CashSessionAuditLog).where(
-            CashSessionAuditLog.session_id == session.id
+        stmt = (
+            select(func.count())
+            .select_from(CashSessionAuditLog)
+            .where(CashSessionAuditLog.session_id == session.id)
         )
         result = await db_session.execute(stmt)
-        logs = result.scalars().all()
 
-        assert len(logs) > 0
+        assert result.scalar_one() > 0
 
     @pytest.mark.asyncio
     async def test_audit_log_tracks_changed_fields(
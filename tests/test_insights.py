@@ -3,12 +3,8 @@
 from datetime import date
 from decimal import Decimal
 
-import pytest
-
 from cashpilot.services.insights import (
     FLAG_RATE_ALERT_THRESHOLD,
-    GROWTH_ALERT_NEGATIVE_THRESHOLD,
-    GROWTH_ALERT_POSITIVE_THRESHOLD,
     detect_revenue_anomalies,
     generate_alerts,
     generate_business_stats_summary,
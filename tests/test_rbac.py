@@ -4,8 +4,7 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cashpilot.models.user import User, UserRole
-from cashpilot.core.security import hash_password
+from cashpilot.models.user import UserRole
 from cashpilot.utils.datetime import today_local
 from tests.factories import UserFactory, BusinessFactory, CashSessionFactory
 
@@ -2,13 +2,13 @@
 """Tests for Pydantic schema validation."""
 
 import pytest
-from datetime import date, timedelta
+from datetime import timedelta
 from decimal import Decimal
 from pydantic import ValidationError
 from cashpilot.utils.datetime import today_local
 
 from cashpilot.models.user_schemas import UserCreate
-from cashpilot.models.business_schemas import BusinessCreate, BusinessUpdate
+from cashpilot.models.business_schemas import BusinessCreate
 from cashpilot.models.cash_session_schemas import CashSessionCreate
 from uuid import uuid4
 
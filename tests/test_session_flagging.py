@@ -4,7 +4,7 @@ from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cashpilot.models import CashSession, CashSessionAuditLog
+from cashpilot.models import CashSessionAuditLog
 from tests.factories import BusinessFactory, CashSessionFactory
 
 @pytest.mark.asyncio
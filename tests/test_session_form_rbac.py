@@ -5,14 +5,13 @@ from datetime import timedelta
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cashpilot.models.cash_session import CashSession
-from cashpilot.models.user import UserRole
 from cashpilot.models.user_business import UserBusiness
 from cashpilot.utils.datetime import today_local
-from tests.factories import BusinessFactory, UserFactory
+from tests.factories import BusinessFactory
 
 
 class TestSessionFormRBAC:
@@ -152,10 +151,13 @@ class TestSessionFormRBAC:
         assert response.status_code == 400
         assert "Only administrators can change session date" in response.text
 
-        stmt = select(CashSession).where(CashSession.cashier_id == client.test_user.id)
+        stmt = (
+            select(func.count())
+            .select_from(CashSession)
+            .where(CashSession.cashier_id == client.test_user.id)
+        )
         result = await db_session.execute(stmt)
-        sessions = result.scalars().all()
-        assert len(sessions) == 0
+        assert result.scalar_one() == 0
 
     @pytest.mark.asyncio
     async def test_admin_can_override_session_date_on_create(
@@ -203,7 +205,10 @@ class TestSessionFormRBAC:
         assert response.status_code == 400
         assert "Session date cannot be in the future" in response.text
 
-        stmt = select(CashSession).where(CashSession.cashier_id == admin_client.test_user.id)
+        stmt = (
+            select(func.count())
+            .select_from(CashSession)
+            .where(CashSession.cashier_id == admin_client.test_user.id)
+        )
         result = await db_session.execute(stmt)
-        sessions = result.scalars().all()
-        assert len(sessions) == 0
\ No newline at end of file
+        assert result.scalar_one() == 0
\ No newline at end of file
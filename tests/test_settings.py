@@ -7,7 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cashpilot.models.user import User
-from cashpilot.core.security import hash_password, verify_password
+from cashpilot.core.security import verify_password
 
 
 class TestPasswordChange:
@@ -115,4 +115,5 @@ class TestPasswordChange:
             follow_redirects=False,
         )
 
-        assert response.status_code in [401, 303]
+        assert response.status_code == 303
+        assert response.headers["location"].startswith("/login")
@@ -2,7 +2,7 @@
 """Tests for core validation utilities."""
 
 import pytest
-from datetime import date, timedelta
+from datetime import timedelta
 from decimal import Decimal
 from cashpilot.utils.datetime import today_local
 
@@ -5,25 +5,11 @@ from decimal import Decimal
 from uuid import uuid4
 
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cashpilot.main import create_app
 from cashpilot.models import Business, CashSession, User, UserRole
 
 
-@pytest.fixture
-def app():
-    """Create FastAPI app for testing."""
-    return create_app()
-
-
-@pytest.fixture
-def client(app):
-    """Create test client."""
-    return TestClient(app)
-
-
 @pytest.fixture
 async def setup_test_data(db_session: AsyncSession):
     """Create test business and user with sample sessions across multiple weeks."""